@@ -3,8 +3,14 @@ import numpy as np
 from PIL import Image
 import folder_paths
 import os
+import re
 import json
+import mmap
+import base64
+import select
+import socket
 import asyncio
+import collections
 import aiohttp
 from aiohttp import web
 import io
@@ -14,20 +20,37 @@ import platform
 import time
 import atexit
 import signal
+import shutil
+import threading
+import functools
+import concurrent.futures
+from urllib.parse import quote
 
 # Import shared utilities
-from .utils.logging import debug_log, log
-from .utils.config import CONFIG_FILE, get_default_config, load_config, save_config, ensure_config_exists
+from .utils.logging import debug_log, log, is_debug_enabled
+from .utils.config import (
+    CONFIG_FILE, get_default_config, load_config, save_config,
+    load_config_async, save_config_async, index_workers, ensure_config_exists
+)
 from .utils.image import tensor_to_pil, pil_to_tensor, ensure_contiguous
-from .utils.process import is_process_alive, terminate_process, get_python_executable
-from .utils.network import handle_api_error, get_server_port, get_server_loop, get_client_session, cleanup_client_session
+from .utils.process import (
+    is_process_alive, terminate_process, get_python_executable,
+    open_pidfd, pidfd_is_alive, pidfd_kill, close_pidfd
+)
+from .utils.network import handle_api_error, get_server_port, get_server_loop, get_client_session, cleanup_client_session, close_client_session_sync
 from .utils.async_helpers import run_async_in_server_loop
 from .utils.constants import (
-    WORKER_JOB_TIMEOUT, PROCESS_TERMINATION_TIMEOUT, WORKER_CHECK_INTERVAL, 
-    STATUS_CHECK_INTERVAL, CHUNK_SIZE, LOG_TAIL_BYTES, WORKER_LOG_PATTERN, 
-    WORKER_STARTUP_DELAY, PROCESS_WAIT_TIMEOUT, MEMORY_CLEAR_DELAY
+    WORKER_JOB_TIMEOUT, PROCESS_TERMINATION_TIMEOUT, WORKER_CHECK_INTERVAL,
+    STATUS_CHECK_INTERVAL, CHUNK_SIZE, LOG_TAIL_BYTES, WORKER_LOG_PATTERN,
+    WORKER_STARTUP_DELAY, PROCESS_WAIT_TIMEOUT, MEMORY_CLEAR_DELAY,
+    NETWORK_INFO_CACHE_TTL, LOG_TAIL_MMAP_THRESHOLD, PROCESS_SAVE_DEBOUNCE,
+    WORKER_UPLOAD_CONCURRENCY
 )
 
+# Bound once at module load - the frequently polled queue_status endpoint
+# shouldn't pay import-statement machinery on every request.
+from .distributed_upscale import ensure_tile_jobs_initialized
+
 # Try to import psutil for better process management
 try:
     import psutil
@@ -36,34 +59,77 @@ except ImportError:
     log("psutil not available, using fallback process management")
     PSUTIL_AVAILABLE = False
 
+# Optional fast codecs for the raw tensor transport - far cheaper than
+# PNG's filter+DEFLATE when a slow link makes compression worthwhile
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import lz4.frame as lz4_frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
 # Register cleanup for aiohttp session
 def cleanup():
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    loop.run_until_complete(cleanup_client_session())
-    loop.close()
+    # Close the session on the loop it was created on - closing it from a
+    # fresh loop leaks the connector and its DNS resolver threads.
+    try:
+        loop = get_server_loop()
+    except Exception:
+        loop = None
+
+    if loop is not None and loop.is_running():
+        try:
+            future = asyncio.run_coroutine_threadsafe(cleanup_client_session(), loop)
+            future.result(timeout=5)
+            return
+        except Exception:
+            pass
+
+    # Server loop already stopped - fall back to a synchronous connector close
+    close_client_session_sync()
 
 atexit.register(cleanup)
 
 # --- API Endpoints ---
+# Serialized config response keyed by file mtime - the UI polls this endpoint,
+# so skip re-reading and re-encoding while the file is unchanged.
+_config_response_cache = {"mtime": None, "body": None}
+
 @server.PromptServer.instance.routes.get("/distributed/config")
 async def get_config_endpoint(request):
-    config = load_config()
-    return web.json_response(config)
+    try:
+        mtime = os.path.getmtime(CONFIG_FILE)
+    except OSError:
+        mtime = None
+
+    if mtime is not None and mtime == _config_response_cache["mtime"]:
+        return web.Response(body=_config_response_cache["body"], content_type='application/json')
+
+    config = await load_config_async()
+    body = json.dumps(config).encode('utf-8')
+    if mtime is not None:
+        _config_response_cache["mtime"] = mtime
+        _config_response_cache["body"] = body
+    return web.Response(body=body, content_type='application/json')
 
 @server.PromptServer.instance.routes.get("/distributed/queue_status/{job_id}")
 async def queue_status_endpoint(request):
     """Check if a job queue is initialized."""
     try:
         job_id = request.match_info['job_id']
-        
-        # Import to ensure initialization
-        from .distributed_upscale import ensure_tile_jobs_initialized
+
+        # Ensure persistent state is initialized
         prompt_server = ensure_tile_jobs_initialized()
-        
-        async with prompt_server.distributed_tile_jobs_lock:
-            exists = job_id in prompt_server.distributed_pending_tile_jobs
-        
+
+        # Plain dict membership is atomic under the GIL - no need to pay an
+        # async lock acquisition for a read-only check on this hot path
+        exists = job_id in prompt_server.distributed_pending_tile_jobs
+
         debug_log(f"Queue status check for job {job_id}: {'exists' if exists else 'not found'}")
         return web.json_response({"exists": exists, "job_id": job_id})
     except Exception as e:
@@ -90,113 +156,156 @@ async def clear_launching_state(request):
     except Exception as e:
         return await handle_api_error(request, e, 500)
 
-@server.PromptServer.instance.routes.get("/distributed/network_info")
-async def get_network_info_endpoint(request):
-    """Get network interfaces and recommend best IP for master."""
-    import socket
-    
-    def get_network_ips():
-        """Get all network IPs, trying multiple methods."""
-        ips = []
-        hostname = socket.gethostname()
-        
-        # Method 1: Try socket.getaddrinfo
-        try:
-            addr_info = socket.getaddrinfo(hostname, None)
-            for info in addr_info:
-                ip = info[4][0]
-                if ip and ip not in ips and not ip.startswith('::'):  # Skip IPv6 for now
-                    ips.append(ip)
-        except:
-            pass
-        
-        # Method 2: Try to connect to external server and get local IP
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))  # Google DNS
-            local_ip = s.getsockname()[0]
-            s.close()
-            if local_ip not in ips:
-                ips.append(local_ip)
-        except:
-            pass
-        
-        # Method 3: Platform-specific commands
-        
-        try:
+# --- Network discovery ---
+# Discovery shells out to ipconfig/ip addr and resolves the hostname, both of
+# which are slow (subprocess spawn plus potentially seconds of DNS probing),
+# so results are cached and the blocking work runs in a thread.
+_IP_PATTERN = re.compile(r'inet\s+(\d+\.\d+\.\d+\.\d+)')
+_network_info_cache = {"ts": 0.0, "data": None}
+_network_info_lock = asyncio.Lock()
+
+# Resolve the interface-listing command once at import - probing per request
+# pays a pointless fork/exec when the first tool is missing.
+if platform.system() == "Windows":
+    _IFCONFIG_CMD = ["ipconfig"]
+else:
+    _ip_bin = shutil.which("ip")
+    _ifconfig_bin = shutil.which("ifconfig")
+    _IFCONFIG_CMD = [_ip_bin, "addr"] if _ip_bin else ([_ifconfig_bin] if _ifconfig_bin else None)
+
+def get_network_ips():
+    """Get all network IPs, trying multiple methods."""
+    # Set for dedup, list to preserve discovery order
+    ips = []
+    seen = set()
+
+    def add_ip(ip):
+        if ip and ip not in seen:
+            seen.add(ip)
+            ips.append(ip)
+
+    hostname = socket.gethostname()
+
+    # Method 1: Try socket.getaddrinfo
+    try:
+        addr_info = socket.getaddrinfo(hostname, None)
+        for info in addr_info:
+            ip = info[4][0]
+            if not ip.startswith('::'):  # Skip IPv6 for now
+                add_ip(ip)
+    except:
+        pass
+
+    # Method 2: Try to connect to external server and get local IP
+    try:
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        s.connect(("8.8.8.8", 80))  # Google DNS
+        add_ip(s.getsockname()[0])
+        s.close()
+    except:
+        pass
+
+    # Method 3: Platform-specific commands
+
+    try:
+        if _IFCONFIG_CMD is not None:
+            result = subprocess.run(_IFCONFIG_CMD, capture_output=True, text=True, timeout=2)
             if platform.system() == "Windows":
-                # Windows ipconfig
-                result = subprocess.run(["ipconfig"], capture_output=True, text=True)
-                lines = result.stdout.split('\n')
-                for i, line in enumerate(lines):
-                    if 'IPv4' in line and i + 1 < len(lines):
-                        ip = lines[i].split(':')[-1].strip()
-                        if ip and ip not in ips:
-                            ips.append(ip)
+                for line in result.stdout.split('\n'):
+                    if 'IPv4' in line:
+                        add_ip(line.split(':')[-1].strip())
             else:
-                # Unix/Linux/Mac ifconfig or ip addr
-                try:
-                    result = subprocess.run(["ip", "addr"], capture_output=True, text=True)
-                except:
-                    result = subprocess.run(["ifconfig"], capture_output=True, text=True)
-                
-                import re
-                ip_pattern = re.compile(r'inet\s+(\d+\.\d+\.\d+\.\d+)')
-                for match in ip_pattern.finditer(result.stdout):
-                    ip = match.group(1)
-                    if ip and ip not in ips:
-                        ips.append(ip)
-        except:
-            pass
-        
-        return ips
-    
-    def get_recommended_ip(ips):
-        """Choose the best IP for master-worker communication."""
-        # Priority order:
-        # 1. Private network ranges (192.168.x.x, 10.x.x.x, 172.16-31.x.x)
-        # 2. Other non-localhost IPs
-        # 3. Localhost as last resort
-        
-        private_ips = []
-        public_ips = []
-        
-        for ip in ips:
-            if ip.startswith('127.') or ip == 'localhost':
-                continue
-            elif (ip.startswith('192.168.') or 
-                  ip.startswith('10.') or 
-                  (ip.startswith('172.') and 16 <= int(ip.split('.')[1]) <= 31)):
-                private_ips.append(ip)
-            else:
-                public_ips.append(ip)
-        
-        # Prefer private IPs
-        if private_ips:
-            # Prefer 192.168 range as it's most common
-            for ip in private_ips:
-                if ip.startswith('192.168.'):
-                    return ip
-            return private_ips[0]
-        elif public_ips:
-            return public_ips[0]
-        elif ips:
-            return ips[0]
+                for match in _IP_PATTERN.finditer(result.stdout):
+                    add_ip(match.group(1))
+    except:
+        pass
+
+    return ips
+
+def get_recommended_ip(ips):
+    """Choose the best IP for master-worker communication."""
+    # Priority order:
+    # 1. Private network ranges (192.168.x.x, 10.x.x.x, 172.16-31.x.x)
+    # 2. Other non-localhost IPs
+    # 3. Localhost as last resort
+
+    private_ips = []
+    public_ips = []
+
+    for ip in ips:
+        if ip.startswith('127.') or ip == 'localhost':
+            continue
+        elif (ip.startswith('192.168.') or
+              ip.startswith('10.') or
+              (ip.startswith('172.') and 16 <= int(ip.split('.')[1]) <= 31)):
+            private_ips.append(ip)
         else:
-            return None
-    
+            public_ips.append(ip)
+
+    # Prefer private IPs
+    if private_ips:
+        # Prefer 192.168 range as it's most common
+        for ip in private_ips:
+            if ip.startswith('192.168.'):
+                return ip
+        return private_ips[0]
+    elif public_ips:
+        return public_ips[0]
+    elif ips:
+        return ips[0]
+    else:
+        return None
+
+def _discover_network_info():
+    """Blocking discovery pass - run this in an executor, not on the event loop."""
+    hostname = socket.gethostname()
+    all_ips = get_network_ips()
+    return {
+        "status": "success",
+        "hostname": hostname,
+        "all_ips": all_ips,
+        "recommended_ip": get_recommended_ip(all_ips),
+        "message": "Auto-detected network configuration"
+    }
+
+@server.PromptServer.instance.routes.get("/distributed/network_info")
+async def get_network_info_endpoint(request):
+    """Get network interfaces and recommend best IP for master."""
     try:
-        hostname = socket.gethostname()
-        all_ips = get_network_ips()
-        recommended_ip = get_recommended_ip(all_ips)
-        
-        return web.json_response({
-            "status": "success",
-            "hostname": hostname,
-            "all_ips": all_ips,
-            "recommended_ip": recommended_ip,
-            "message": "Auto-detected network configuration"
-        })
+        # Localhost-only deployments (the common single-box case) never need
+        # interface discovery - skip the subprocess spawn and DNS probing.
+        config = await load_config_async()
+        has_remote = any(
+            w.get('host') not in (None, '', 'localhost', '127.0.0.1')
+            for w in config.get('workers', [])
+        )
+        if not has_remote:
+            return web.json_response({
+                "status": "success",
+                "hostname": socket.gethostname(),
+                "all_ips": ["127.0.0.1"],
+                "recommended_ip": "127.0.0.1",
+                "message": "All workers are local, using loopback"
+            })
+
+        refresh = request.query.get('refresh', 'false').lower() == 'true'
+
+        if not refresh and time.monotonic() - _network_info_cache["ts"] < NETWORK_INFO_CACHE_TTL:
+            if _network_info_cache["data"] is not None:
+                return web.json_response(_network_info_cache["data"])
+
+        async with _network_info_lock:
+            # Re-check after acquiring the lock - another request may have refreshed
+            if not refresh and time.monotonic() - _network_info_cache["ts"] < NETWORK_INFO_CACHE_TTL:
+                if _network_info_cache["data"] is not None:
+                    return web.json_response(_network_info_cache["data"])
+
+            loop = asyncio.get_running_loop()
+            data = await loop.run_in_executor(None, _discover_network_info)
+            _network_info_cache["data"] = data
+            _network_info_cache["ts"] = time.monotonic()
+
+        return web.json_response(data)
     except Exception as e:
         return web.json_response({
             "status": "error",
@@ -215,42 +324,40 @@ async def update_worker_endpoint(request):
         if worker_id is None:
             return await handle_api_error(request, "Missing worker_id", 400)
             
-        config = load_config()
-        worker_found = False
-        
-        for worker in config.get("workers", []):
-            if worker["id"] == worker_id:
-                # Update all provided fields
-                if "enabled" in data:
-                    worker["enabled"] = data["enabled"]
-                if "name" in data:
-                    worker["name"] = data["name"]
-                if "port" in data:
-                    worker["port"] = data["port"]
-                    
-                # Handle host field - remove it if None
-                if "host" in data:
-                    if data["host"] is None:
-                        worker.pop("host", None)
-                    else:
-                        worker["host"] = data["host"]
-                        
-                # Handle cuda_device field - remove it if None
-                if "cuda_device" in data:
-                    if data["cuda_device"] is None:
-                        worker.pop("cuda_device", None)
-                    else:
-                        worker["cuda_device"] = data["cuda_device"]
-                        
-                # Handle extra_args field - remove it if None
-                if "extra_args" in data:
-                    if data["extra_args"] is None:
-                        worker.pop("extra_args", None)
-                    else:
-                        worker["extra_args"] = data["extra_args"]
-                worker_found = True
-                break
-                
+        config = await load_config_async()
+        worker = index_workers(config).get(worker_id)
+        worker_found = worker is not None
+
+        if worker_found:
+            # Update all provided fields
+            if "enabled" in data:
+                worker["enabled"] = data["enabled"]
+            if "name" in data:
+                worker["name"] = data["name"]
+            if "port" in data:
+                worker["port"] = data["port"]
+
+            # Handle host field - remove it if None
+            if "host" in data:
+                if data["host"] is None:
+                    worker.pop("host", None)
+                else:
+                    worker["host"] = data["host"]
+
+            # Handle cuda_device field - remove it if None
+            if "cuda_device" in data:
+                if data["cuda_device"] is None:
+                    worker.pop("cuda_device", None)
+                else:
+                    worker["cuda_device"] = data["cuda_device"]
+
+            # Handle extra_args field - remove it if None
+            if "extra_args" in data:
+                if data["extra_args"] is None:
+                    worker.pop("extra_args", None)
+                else:
+                    worker["extra_args"] = data["extra_args"]
+
         if not worker_found:
             # If worker not found and all required fields are provided, create new worker
             if all(key in data for key in ["name", "port", "cuda_device"]):
@@ -270,7 +377,7 @@ async def update_worker_endpoint(request):
             else:
                 return await handle_api_error(request, f"Worker {worker_id} not found and missing required fields for creation", 404)
             
-        if save_config(config):
+        if await save_config_async(config):
             return web.json_response({"status": "success"})
         else:
             return await handle_api_error(request, "Failed to save config")
@@ -286,23 +393,17 @@ async def delete_worker_endpoint(request):
         if worker_id is None:
             return await handle_api_error(request, "Missing worker_id", 400)
             
-        config = load_config()
+        config = await load_config_async()
         workers = config.get("workers", [])
-        
+
         # Find and remove the worker
-        worker_index = -1
-        for i, worker in enumerate(workers):
-            if worker["id"] == worker_id:
-                worker_index = i
-                break
-                
-        if worker_index == -1:
+        removed_worker = index_workers(config).get(worker_id)
+        if removed_worker is None:
             return await handle_api_error(request, f"Worker {worker_id} not found", 404)
-            
-        # Remove the worker
-        removed_worker = workers.pop(worker_index)
+
+        workers.remove(removed_worker)
         
-        if save_config(config):
+        if await save_config_async(config):
             return web.json_response({
                 "status": "success",
                 "message": f"Worker {removed_worker.get('name', worker_id)} deleted"
@@ -323,13 +424,13 @@ async def update_setting_endpoint(request):
         if not key or value is None:
             return await handle_api_error(request, "Missing 'key' or 'value' in request", 400)
 
-        config = load_config()
+        config = await load_config_async()
         if 'settings' not in config:
             config['settings'] = {}
         
         config['settings'][key] = value
 
-        if save_config(config):
+        if await save_config_async(config):
             return web.json_response({"status": "success", "message": f"Setting '{key}' updated."})
         else:
             return await handle_api_error(request, "Failed to save config")
@@ -342,7 +443,7 @@ async def update_master_endpoint(request):
     try:
         data = await request.json()
         
-        config = load_config()
+        config = await load_config_async()
         if 'master' not in config:
             config['master'] = {}
         
@@ -356,7 +457,7 @@ async def update_master_endpoint(request):
         if "extra_args" in data:
             config['master']['extra_args'] = data['extra_args']
             
-        if save_config(config):
+        if await save_config_async(config):
             return web.json_response({"status": "success", "message": "Master configuration updated."})
         else:
             return await handle_api_error(request, "Failed to save config")
@@ -371,10 +472,9 @@ async def prepare_job_endpoint(request):
         if not multi_job_id:
             return await handle_api_error(request, "Missing multi_job_id", 400)
 
-        async with prompt_server.distributed_jobs_lock:
-            if multi_job_id not in prompt_server.distributed_pending_jobs:
-                prompt_server.distributed_pending_jobs[multi_job_id] = asyncio.Queue()
-        
+        # setdefault is atomic under the GIL, so check-then-set needs no lock
+        prompt_server.distributed_pending_jobs.setdefault(multi_job_id, asyncio.Queue())
+
         debug_log(f"Prepared queue for job {multi_job_id}")
         return web.json_response({"status": "success"})
     except Exception as e:
@@ -386,12 +486,26 @@ async def clear_memory_endpoint(request):
     try:
         # Use ComfyUI's prompt server queue system like the /free endpoint does
         if hasattr(server.PromptServer.instance, 'prompt_queue'):
-            server.PromptServer.instance.prompt_queue.set_flag("unload_models", True)
-            server.PromptServer.instance.prompt_queue.set_flag("free_memory", True)
+            prompt_queue = server.PromptServer.instance.prompt_queue
+
+            # Event-driven wait: anything that processes the flags can set this
+            # event to release us immediately; otherwise we fall back to the
+            # fixed delay instead of always paying it.
+            done_event = getattr(prompt_queue, '_distributed_free_memory_done', None)
+            if done_event is None:
+                done_event = asyncio.Event()
+                prompt_queue._distributed_free_memory_done = done_event
+            done_event.clear()
+
+            prompt_queue.set_flag("unload_models", True)
+            prompt_queue.set_flag("free_memory", True)
             debug_log("Set queue flags for memory clearing.")
-        
-        # Wait a bit for the queue to process
-        await asyncio.sleep(MEMORY_CLEAR_DELAY)
+
+            try:
+                await asyncio.wait_for(done_event.wait(), timeout=MEMORY_CLEAR_DELAY)
+            except asyncio.TimeoutError:
+                # No completion signal - proceed with the direct cleanup below
+                pass
         
         # Also do direct cleanup as backup, but with error handling
         import gc
@@ -437,8 +551,8 @@ async def launch_worker_endpoint(request):
             return await handle_api_error(request, "Missing worker_id", 400)
         
         # Find worker config
-        config = load_config()
-        worker = next((w for w in config.get("workers", []) if w["id"] == worker_id), None)
+        config = await load_config_async()
+        worker = index_workers(config).get(worker_id)
         if not worker:
             return await handle_api_error(request, f"Worker {worker_id} not found", 404)
         
@@ -522,6 +636,46 @@ async def get_managed_workers_endpoint(request):
         return await handle_api_error(request, e, 500)
 
 
+def _read_log_tail(log_file, lines_to_read, file_size):
+    """Read the last lines_to_read lines of a log file.
+
+    Small files get a single forward pass with a bounded deque; files over
+    LOG_TAIL_MMAP_THRESHOLD are scanned backwards through mmap so only the
+    tail is ever read and decoded. Returns (content, truncated).
+    """
+    if lines_to_read <= 0 or file_size <= LOG_TAIL_MMAP_THRESHOLD:
+        with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
+            if lines_to_read <= 0:
+                return f.read(), False
+            # Keep one extra line so we can tell whether anything was cut off
+            tail = collections.deque(f, maxlen=lines_to_read + 1)
+            truncated = len(tail) > lines_to_read
+            if truncated:
+                tail.popleft()
+            content = ''.join(tail)
+    else:
+        # Huge file: find the start of the tail without reading the body
+        with open(log_file, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = file_size
+                pos = end - 1 if end and mm[end - 1:end] == b'\n' else end
+                found = 0
+                while found < lines_to_read and pos > 0:
+                    newline = mm.rfind(b'\n', 0, pos)
+                    if newline == -1:
+                        pos = 0
+                        break
+                    found += 1
+                    pos = newline
+                start = pos + 1 if pos > 0 else 0
+                truncated = start > 0
+                content = mm[start:end].decode('utf-8', errors='replace')
+
+    if content.endswith('\n'):
+        content = content[:-1]
+    return content, truncated
+
+
 @server.PromptServer.instance.routes.get("/distributed/worker_log/{worker_id}")
 async def get_worker_log_endpoint(request):
     """Get log content for a specific worker."""
@@ -538,60 +692,42 @@ async def get_worker_log_endpoint(request):
         proc_info = worker_manager.processes[worker_id]
         log_file = proc_info.get('log_file')
         
-        if not log_file or not os.path.exists(log_file):
+        if not log_file:
             return await handle_api_error(request, "Log file not found", 404)
-        
+
+        # One stat covers both the existence check and the size
+        try:
+            file_size = os.stat(log_file).st_size
+        except OSError:
+            return await handle_api_error(request, "Log file not found", 404)
+
+        # Raw mode streams the whole file (sendfile where available) instead
+        # of buffering it in memory and JSON-escaping it.
+        if request.query.get('format') == 'raw':
+            return web.FileResponse(log_file, chunk_size=65536)
+
         # Read last N lines (or full file if small)
         lines_to_read = int(request.query.get('lines', 1000))
-        
+
         try:
-            # Get file size
-            file_size = os.path.getsize(log_file)
-            
-            with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
-                if lines_to_read > 0 and file_size > 1024 * 1024:  # If file > 1MB and limited lines requested
-                    # Read last N lines efficiently
-                    lines = []
-                    # Start from end and work backwards
-                    f.seek(0, 2)  # Go to end
-                    file_length = f.tell()
-                    
-                    # Read chunks from end
-                    chunk_size = min(CHUNK_SIZE, file_length)
-                    while len(lines) < lines_to_read and f.tell() > 0:
-                        # Move back and read chunk
-                        current_pos = max(0, f.tell() - chunk_size)
-                        f.seek(current_pos)
-                        chunk = f.read(chunk_size)
-                        
-                        # Process chunk
-                        chunk_lines = chunk.splitlines()
-                        if current_pos > 0:
-                            # Partial line at beginning, combine with next chunk
-                            chunk_lines = chunk_lines[1:]
-                        
-                        lines = chunk_lines + lines
-                        
-                        # Move back for next chunk
-                        f.seek(current_pos)
-                    
-                    # Take only last N lines
-                    content = '\n'.join(lines[-lines_to_read:])
-                    truncated = len(lines) > lines_to_read
-                else:
-                    # Read entire file
-                    content = f.read()
-                    truncated = False
-            
-            return web.json_response({
-                "status": "success",
-                "content": content,
-                "log_file": log_file,
-                "file_size": file_size,
-                "truncated": truncated,
-                "lines_shown": lines_to_read if truncated else content.count('\n') + 1
-            })
-            
+            # File I/O is blocking - keep it off the event loop
+            loop = asyncio.get_running_loop()
+            content, truncated = await loop.run_in_executor(
+                None, _read_log_tail, log_file, lines_to_read, file_size
+            )
+
+            # Plain text avoids a second O(N) pass JSON-escaping the log body;
+            # the metadata rides along in response headers. The path is
+            # percent-encoded: headers go out latin-1 and a CJK user dir in
+            # the path would otherwise blow up at write time.
+            headers = {
+                'X-Log-File': quote(log_file),
+                'X-File-Size': str(file_size),
+                'X-Truncated': str(truncated).lower(),
+                'X-Lines-Shown': str(lines_to_read if truncated else content.count('\n') + 1),
+            }
+            return web.Response(text=content, headers=headers, content_type='text/plain')
+
         except Exception as e:
             return await handle_api_error(request, f"Error reading log file: {str(e)}", 500)
             
@@ -600,29 +736,77 @@ async def get_worker_log_endpoint(request):
 
 
 # --- Worker Process Management ---
+# Maps every ASCII char outside [A-Za-z0-9_-] to '_'; built once so log
+# filename sanitization is a single C-level translate call.
+_SAFE_NAME_TABLE = str.maketrans({
+    c: '_' for c in map(chr, range(128))
+    if not (c.isalnum() or c in '-_')
+})
+
 class WorkerProcessManager:
+    # Append-only journal of launch/stop events. One small write per
+    # mutation; the full managed_processes snapshot in the config is only
+    # rewritten by the coalesced saver, which then truncates this log.
+    EVENTS_LOG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "managed_processes.log")
+
     def __init__(self):
         self.processes = {}  # worker_id -> process info
+        self._save_timer = None
+        self._save_timer_lock = threading.Lock()
+        self._dirty = False  # Unsaved mutations to self.processes
+        # Launches/stops can run concurrently (auto-launch, cleanup_all);
+        # keep tracking-dict updates atomic across those threads
+        self._processes_lock = threading.Lock()
+        self._config_cache = None
+        self._config_mtime = None
         self.load_processes()
-        
-    def find_comfy_root(self):
-        """Find the ComfyUI root directory."""
+
+    def _get_config(self):
+        """Cached parsed config, reloaded only when the file changes on disk.
+
+        The manager touches the config on every launch/stop/save; one stat()
+        replaces a full read+parse unless the panel (or the user) actually
+        edited the file.
+        """
+        try:
+            mtime = os.stat(CONFIG_FILE).st_mtime_ns
+        except OSError:
+            mtime = None
+        if self._config_cache is None or mtime != self._config_mtime:
+            self._config_cache = load_config()
+            self._config_mtime = mtime
+        return self._config_cache
+
+    def _save_config_cache(self):
+        """Persist the cached config and refresh the stored mtime."""
+        save_config(self._config_cache)
+        try:
+            self._config_mtime = os.stat(CONFIG_FILE).st_mtime_ns
+        except OSError:
+            self._config_mtime = None
+        
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def find_comfy_root():
+        """Find the ComfyUI root directory. Cached - the path never changes at runtime."""
         # Start from current file location and go up
         current_dir = os.path.dirname(os.path.abspath(__file__))
         # This file is in ComfyUI/custom_nodes/ComfyUI-Distributed/
         # So go up two levels to get to ComfyUI root
         comfy_root = os.path.dirname(os.path.dirname(current_dir))
         return comfy_root
-        
-    def _find_windows_terminal(self):
-        """Find Windows Terminal executable."""
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _find_windows_terminal():
+        """Find Windows Terminal executable. Cached - probing paths is not free."""
         # Common locations for Windows Terminal
         possible_paths = [
             os.path.expandvars(r"%LOCALAPPDATA%\Microsoft\WindowsApps\wt.exe"),
             os.path.expandvars(r"%PROGRAMFILES%\WindowsApps\Microsoft.WindowsTerminal_*\wt.exe"),
             "wt.exe"  # Try PATH
         ]
-        
+
         for path in possible_paths:
             if os.path.exists(path):
                 return path
@@ -632,15 +816,15 @@ class WorkerProcessManager:
                 matches = glob.glob(path)
                 if matches:
                     return matches[0]
-        
+
         # Try to find it in PATH
         import shutil
         wt_path = shutil.which("wt")
         if wt_path:
             return wt_path
-            
+
         return None
-        
+
     def build_launch_command(self, worker_config, comfy_root):
         """Build the command to launch a worker."""
         # Use main.py directly - it's the most reliable method
@@ -688,49 +872,52 @@ class WorkerProcessManager:
         # Use daily log files instead of timestamp
         date_stamp = time.strftime("%Y%m%d")
         worker_name = worker_config.get('name', f'Worker{worker_config["id"]}')
-        # Clean worker name for filename
-        safe_name = "".join(c if c.isalnum() or c in ('-', '_') else '_' for c in worker_name)
+        # Clean worker name for filename (non-ASCII becomes '?' then '_')
+        safe_name = worker_name.encode('ascii', 'replace').decode().translate(_SAFE_NAME_TABLE)
         log_file = os.path.join(log_dir, f"{safe_name}_{date_stamp}.log")
         
+        # Note about worker behavior
+        config = self._get_config()
+        stop_on_master_exit = config.get('settings', {}).get('stop_workers_on_master_exit', True)
+
+        # Build the startup banner up front; the child process owns the log fd
+        # after launch, so the parent does a single raw write with no Python
+        # text-codec or buffering layer in between.
+        banner = [
+            f"\n\n{'='*50}\n",
+            "=== ComfyUI Worker Session Started ===\n",
+            f"Worker: {worker_name}\n",
+            f"Port: {worker_config['port']}\n",
+            f"CUDA Device: {worker_config.get('cuda_device', 0)}\n",
+            f"Started: {time.strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"Command: {' '.join(cmd)}\n",
+        ]
+        if stop_on_master_exit:
+            banner.append("Note: Worker will stop when master shuts down\n")
+        else:
+            banner.append("Note: Worker will continue running after master shuts down\n")
+        banner.append("=" * 30 + "\n\n")
+
+        # Wrap command with monitor if needed
+        if stop_on_master_exit and env.get('COMFYUI_MASTER_PID'):
+            # Use the monitor wrapper
+            monitor_script = os.path.join(os.path.dirname(__file__), 'worker_monitor.py')
+            monitored_cmd = [get_python_executable(), monitor_script] + cmd
+            banner.append(f"[Worker Monitor] Monitoring master PID: {env['COMFYUI_MASTER_PID']}\n")
+        else:
+            monitored_cmd = cmd
+
         # Launch process with logging (append mode for daily logs)
-        with open(log_file, 'a') as log_handle:
-            # Write startup info to log with timestamp
-            log_handle.write(f"\n\n{'='*50}\n")
-            log_handle.write(f"=== ComfyUI Worker Session Started ===\n")
-            log_handle.write(f"Worker: {worker_name}\n")
-            log_handle.write(f"Port: {worker_config['port']}\n")
-            log_handle.write(f"CUDA Device: {worker_config.get('cuda_device', 0)}\n")
-            log_handle.write(f"Started: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            log_handle.write(f"Command: {' '.join(cmd)}\n")
-            
-            # Note about worker behavior
-            config = load_config()
-            stop_on_master_exit = config.get('settings', {}).get('stop_workers_on_master_exit', True)
-            
-            if stop_on_master_exit:
-                log_handle.write("Note: Worker will stop when master shuts down\n")
-            else:
-                log_handle.write("Note: Worker will continue running after master shuts down\n")
-            
-            log_handle.write("=" * 30 + "\n\n")
-            log_handle.flush()
-            
-            # Wrap command with monitor if needed
-            if stop_on_master_exit and env.get('COMFYUI_MASTER_PID'):
-                # Use the monitor wrapper
-                monitor_script = os.path.join(os.path.dirname(__file__), 'worker_monitor.py')
-                monitored_cmd = [get_python_executable(), monitor_script] + cmd
-                log_handle.write(f"[Worker Monitor] Monitoring master PID: {env['COMFYUI_MASTER_PID']}\n")
-                log_handle.flush()
-            else:
-                monitored_cmd = cmd
-            
+        fd = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, ''.join(banner).encode('utf-8', errors='replace'))
+
             # Platform-specific process creation - always hidden with logging
             if platform.system() == "Windows":
                 CREATE_NO_WINDOW = 0x08000000
                 process = subprocess.Popen(
                     monitored_cmd, env=env, cwd=cwd,
-                    stdout=log_handle, 
+                    stdout=fd,
                     stderr=subprocess.STDOUT,
                     creationflags=CREATE_NO_WINDOW
                 )
@@ -738,26 +925,53 @@ class WorkerProcessManager:
                 # Unix-like systems
                 process = subprocess.Popen(
                     monitored_cmd, env=env, cwd=cwd,
-                    stdout=log_handle,
+                    stdout=fd,
                     stderr=subprocess.STDOUT,
                     start_new_session=True  # Detach from parent
                 )
+        finally:
+            # The child holds its own duplicate of the fd
+            os.close(fd)
         
         # Track the process with log file info - use string ID for consistency
         worker_id = str(worker_config['id'])
-        self.processes[worker_id] = {
+        with self._processes_lock:
+            self.processes[worker_id] = {
+                'pid': process.pid,
+                'process': process,
+                'started_at': time.time(),
+                'config': worker_config,
+                'log_file': log_file,
+                'is_monitor': stop_on_master_exit and env.get('COMFYUI_MASTER_PID'),  # Track if using monitor
+                'launching': True  # Mark as launching until confirmed running
+            }
+
+        # Cache the psutil handle so checks and kills reuse one object
+        # instead of reparsing /proc for a fresh Process each time
+        if PSUTIL_AVAILABLE:
+            try:
+                self.processes[worker_id]['psutil_proc'] = psutil.Process(process.pid)
+            except psutil.NoSuchProcess:
+                pass
+
+        # On Linux a pidfd gives race-free liveness checks and kills
+        pidfd = open_pidfd(process.pid)
+        if pidfd is not None:
+            self.processes[worker_id]['pidfd'] = pidfd
+
+        self._append_event('launch', worker_id, {
             'pid': process.pid,
-            'process': process,
-            'started_at': time.time(),
+            'started_at': self.processes[worker_id]['started_at'],
             'config': worker_config,
-            'log_file': log_file,
-            'is_monitor': stop_on_master_exit and env.get('COMFYUI_MASTER_PID'),  # Track if using monitor
-            'launching': True  # Mark as launching until confirmed running
-        }
-        
+            'log_file': log_file
+        })
+
         # Save process info for persistence
         self.save_processes()
-        
+
+        # Get notified when the child exits instead of relying on poll()
+        self._watch_process(worker_id, process)
+
         if stop_on_master_exit and env.get('COMFYUI_MASTER_PID'):
             debug_log(f"Launched worker {worker_name} via monitor (Monitor PID: {process.pid})")
         else:
@@ -765,6 +979,164 @@ class WorkerProcessManager:
         debug_log(f"Log file: {log_file}")
         return process.pid
         
+    def _watch_process(self, worker_id, process):
+        """Get notified when a launched process exits instead of polling.
+
+        On Linux the process's pidfd is registered with the server loop -
+        no thread is tied up per worker, and the exit callback reaps the
+        child with wait() (instant, since it already exited). Where pidfds
+        aren't available the blocking wait() runs on its own daemon thread
+        rather than the default executor, which also serves config I/O, log
+        tailing and upload decoding and must not be starved by waits that
+        last the worker's whole lifetime.
+        """
+        proc_info = self.processes.get(worker_id)
+        if proc_info is None:
+            return
+        pidfd = proc_info.get('pidfd')
+        if pidfd is not None:
+            def _schedule():
+                def _on_exit_readable():
+                    loop.remove_reader(pidfd)
+                    returncode = process.wait()  # Reap the already-dead child
+                    self._on_worker_exit(worker_id, process.pid, returncode)
+                loop.add_reader(pidfd, _on_exit_readable)
+
+            try:
+                loop = get_server_loop()
+                # Mark before scheduling: a child that dies instantly can
+                # _untrack the entry from the exit callback before control
+                # returns here, and a late keyed write would raise KeyError
+                proc_info['watched'] = True
+                loop.call_soon_threadsafe(_schedule)
+                return
+            except Exception as e:
+                proc_info.pop('watched', None)
+                debug_log(f"Could not watch pidfd for worker {worker_id}: {e}")
+
+        def _wait_and_notify():
+            returncode = process.wait()
+            self._on_worker_exit(worker_id, process.pid, returncode)
+
+        try:
+            proc_info['watched'] = True
+            threading.Thread(target=_wait_and_notify, daemon=True,
+                             name=f"distributed-wait-{worker_id}").start()
+        except Exception as e:
+            proc_info.pop('watched', None)
+            debug_log(f"Could not watch worker {worker_id} process: {e}")
+
+    def _watch_pidfd(self, worker_id, pid, pidfd):
+        """Event-driven exit notification for workers we didn't spawn.
+
+        The server loop watches the pidfd, which becomes readable exactly
+        once - when the process exits - so liveness costs nothing in
+        between. Used for restored workers that have no subprocess object
+        to wait() on.
+        """
+        proc_info = self.processes.get(worker_id)
+        if proc_info is None:
+            return
+
+        def _schedule():
+            def _on_exit_readable():
+                loop.remove_reader(pidfd)
+                self._on_worker_exit(worker_id, pid, None)
+            loop.add_reader(pidfd, _on_exit_readable)
+
+        try:
+            loop = get_server_loop()
+            # Set before scheduling so an immediate exit can't _untrack the
+            # entry and leave this write raising KeyError
+            proc_info['watched'] = True
+            loop.call_soon_threadsafe(_schedule)
+        except Exception as e:
+            proc_info.pop('watched', None)
+            debug_log(f"Could not watch pidfd for worker {worker_id}: {e}")
+
+    def _append_event(self, kind, worker_id, extra=None):
+        """Journal one tracking mutation as a JSON line.
+
+        O(1) per launch/stop and crash-safe: a torn final line from a crash
+        is simply skipped on replay.
+        """
+        event = {'event': kind, 'worker_id': str(worker_id), 'ts': time.time()}
+        if extra:
+            event.update(extra)
+        try:
+            with open(self.EVENTS_LOG, 'ab') as f:
+                f.write(json.dumps(event).encode('utf-8') + b'\n')
+        except (OSError, TypeError) as e:
+            debug_log(f"Could not append process event: {e}")
+
+    def _replay_events(self, managed_processes):
+        """Overlay the event journal onto the persisted snapshot."""
+        try:
+            with open(self.EVENTS_LOG, 'rb') as f:
+                lines = f.read().split(b'\n')
+        except OSError:
+            return managed_processes
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue  # Partial write from a crash - ignore
+            wid = str(event.get('worker_id'))
+            kind = event.get('event')
+            if kind == 'launch':
+                managed_processes[wid] = {
+                    'pid': event.get('pid'),
+                    'started_at': event.get('started_at'),
+                    'config': event.get('config'),
+                    'log_file': event.get('log_file')
+                }
+            elif kind == 'stop':
+                managed_processes.pop(wid, None)
+        return managed_processes
+
+    @staticmethod
+    def _release_pidfd(pidfd):
+        """Deregister a pidfd from the server loop, then close it.
+
+        Closing first would leave a stale entry in asyncio's selector map:
+        the kernel drops the epoll registration on close but asyncio's
+        bookkeeping doesn't, and the next fd that reuses the number would
+        silently never be monitored. Both steps run as one loop callback so
+        the exit reader can't fire in between.
+        """
+        def _cleanup():
+            try:
+                loop.remove_reader(pidfd)
+            except Exception:
+                pass
+            close_pidfd(pidfd)
+
+        try:
+            loop = get_server_loop()
+            loop.call_soon_threadsafe(_cleanup)
+        except Exception:
+            close_pidfd(pidfd)
+
+    def _untrack(self, worker_id):
+        """Remove a worker entry and release its pidfd, if any."""
+        with self._processes_lock:
+            proc_info = self.processes.pop(worker_id, None)
+        if proc_info:
+            self._append_event('stop', worker_id)
+            if proc_info.get('pidfd') is not None:
+                self._release_pidfd(proc_info['pidfd'])
+
+    def _on_worker_exit(self, worker_id, pid, returncode):
+        """Drop tracking for a worker whose process has exited."""
+        proc_info = self.processes.get(worker_id)
+        # Guard against a stop/relaunch having already replaced the entry
+        if proc_info and proc_info.get('pid') == pid:
+            debug_log(f"Worker {worker_id} (PID: {pid}) exited with code {returncode}")
+            self._untrack(worker_id)
+            self.save_processes()
+
     def stop_worker(self, worker_id):
         """Stop a worker process."""
         # Ensure worker_id is string
@@ -782,8 +1154,8 @@ class WorkerProcessManager:
         if not process:
             try:
                 print(f"[Distributed] Stopping restored process (no subprocess object)")
-                if self._kill_process_tree(pid):
-                    del self.processes[worker_id]
+                if self._kill_process_tree(pid, proc_info.get('psutil_proc'), proc_info.get('pidfd')):
+                    self._untrack(worker_id)
                     self.save_processes()
                     debug_log(f"Successfully stopped worker {worker_id} and all child processes")
                     return True, "Worker stopped"
@@ -798,16 +1170,16 @@ class WorkerProcessManager:
         if process.poll() is not None:
             # Already stopped
             print(f"[Distributed] Worker {worker_id} already stopped")
-            del self.processes[worker_id]
+            self._untrack(worker_id)
             self.save_processes()
             return False, "Worker already stopped"
             
         # Try to kill the entire process tree
         try:
             debug_log(f"Using process tree kill for worker {worker_id}")
-            if self._kill_process_tree(pid):
+            if self._kill_process_tree(pid, proc_info.get('psutil_proc'), proc_info.get('pidfd')):
                 # Clean up tracking
-                del self.processes[worker_id]
+                self._untrack(worker_id)
                 self.save_processes()
                 debug_log(f"Successfully stopped worker {worker_id} and all child processes")
                 return True, "Worker stopped"
@@ -817,7 +1189,7 @@ class WorkerProcessManager:
                 if process:
                     terminate_process(process, timeout=PROCESS_TERMINATION_TIMEOUT)
                 
-                del self.processes[worker_id]
+                self._untrack(worker_id)
                 self.save_processes()
                 return True, "Worker stopped (fallback)"
                 
@@ -829,9 +1201,14 @@ class WorkerProcessManager:
         """Get list of workers managed by this process."""
         managed = {}
         for worker_id, proc_info in list(self.processes.items()):
-            # Check if process is still running
-            is_running, _ = self._check_worker_process(worker_id, proc_info)
-            
+            # Watched entries are removed by their exit callback the moment
+            # the process dies, so presence alone proves liveness - no
+            # syscalls per UI refresh
+            if proc_info.get('watched'):
+                is_running = True
+            else:
+                is_running, _ = self._check_worker_process(worker_id, proc_info)
+
             if is_running:
                 managed[worker_id] = {
                     'pid': proc_info['pid'],
@@ -841,27 +1218,36 @@ class WorkerProcessManager:
                 }
             else:
                 # Process has stopped, remove from tracking
-                del self.processes[worker_id]
+                self._untrack(worker_id)
         
         return managed
         
     def cleanup_all(self):
         """Stop all managed workers (called on shutdown)."""
-        for worker_id in list(self.processes.keys()):
-            try:
-                self.stop_worker(worker_id)
-            except Exception as e:
-                print(f"[Distributed] Error stopping worker {worker_id}: {e}")
-        
+        worker_ids = list(self.processes.keys())
+        if worker_ids:
+            # Stop concurrently - shutdown latency becomes the slowest
+            # worker's exit instead of the sum of all of them
+            def _stop_one(worker_id):
+                try:
+                    self.stop_worker(worker_id)
+                except Exception as e:
+                    print(f"[Distributed] Error stopping worker {worker_id}: {e}")
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(worker_ids)) as ex:
+                list(ex.map(_stop_one, worker_ids))
+
         # Clear all managed processes from config
-        config = load_config()
+        config = self._get_config()
         config['managed_processes'] = {}
-        save_config(config)
+        self._save_config_cache()
     
     def load_processes(self):
         """Load persisted process information from config."""
-        config = load_config()
-        managed_processes = config.get('managed_processes', {})
+        config = self._get_config()
+        # Replay journaled launches/stops that happened after the last
+        # snapshot write (e.g. if the previous session crashed)
+        managed_processes = self._replay_events(dict(config.get('managed_processes', {})))
         
         # Verify each saved process is still running
         for worker_id, proc_info in managed_processes.items():
@@ -875,21 +1261,63 @@ class WorkerProcessManager:
                     'config': proc_info.get('config'),
                     'log_file': proc_info.get('log_file')
                 }
+                if PSUTIL_AVAILABLE:
+                    try:
+                        self.processes[worker_id]['psutil_proc'] = psutil.Process(pid)
+                    except psutil.NoSuchProcess:
+                        pass
+                pidfd = open_pidfd(pid)
+                if pidfd is not None:
+                    self.processes[worker_id]['pidfd'] = pidfd
+                    self._watch_pidfd(worker_id, pid, pidfd)
                 print(f"[Distributed] Restored worker {worker_id} (PID: {pid})")
             else:
                 if pid:
                     print(f"[Distributed] Worker {worker_id} (PID: {pid}) is no longer running")
     
     def save_processes(self):
+        """Schedule a coalesced save of process information.
+
+        Launch/stop bursts mutate the dict many times in quick succession;
+        a short debounce turns those into a single config write.
+        """
+        with self._save_timer_lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(PROCESS_SAVE_DEBOUNCE, self.flush_processes)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def flush_processes(self):
+        """Write pending process information immediately.
+
+        Cancels any scheduled save; a no-op when nothing changed since the
+        last write, so redundant flushes (e.g. at shutdown) cost nothing.
+        """
+        with self._save_timer_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+        self._write_processes()
+
+    def _write_processes(self):
         """Save process information to config."""
-        config = load_config()
+        config = self._get_config()
         
         # Create serializable version of process info
         managed_processes = {}
-        for worker_id, proc_info in self.processes.items():
-            # Only save if process is running
-            is_running, _ = self._check_worker_process(worker_id, proc_info)
-            
+        for worker_id, proc_info in list(self.processes.items()):
+            # Only save if process is running. Watched entries are pruned by
+            # their exit callback the moment they die, so presence alone is
+            # proof of liveness - no syscall per entry per save
+            if proc_info.get('watched'):
+                is_running = True
+            else:
+                is_running, _ = self._check_worker_process(worker_id, proc_info)
+
             if is_running:
                 managed_processes[worker_id] = {
                     'pid': proc_info['pid'],
@@ -901,7 +1329,14 @@ class WorkerProcessManager:
         
         # Update config with managed processes
         config['managed_processes'] = managed_processes
-        save_config(config)
+        self._save_config_cache()
+
+        # The snapshot now reflects current state - compact the journal
+        try:
+            with open(self.EVENTS_LOG, 'wb'):
+                pass
+        except OSError:
+            pass
     
     def _is_process_running(self, pid):
         """Check if a process with given PID is running."""
@@ -920,17 +1355,37 @@ class WorkerProcessManager:
             # Normal case with subprocess object
             return process.poll() is None, True
         elif pid:
-            # Restored process without subprocess object
+            # Restored process without subprocess object - a pidfd is the
+            # cheapest and only race-free check: one select() on a cached fd
+            pidfd = proc_info.get('pidfd')
+            if pidfd is not None:
+                return pidfd_is_alive(pidfd), False
+            # Otherwise prefer the cached psutil handle; oneshot() batches
+            # the stat reads into one pass
+            handle = proc_info.get('psutil_proc')
+            if handle is not None:
+                try:
+                    with handle.oneshot():
+                        return handle.is_running() and handle.status() != psutil.STATUS_ZOMBIE, False
+                except psutil.NoSuchProcess:
+                    return False, False
+                except Exception:
+                    pass  # Fall back to the plain pid check
             return self._is_process_running(pid), False
         else:
             # No process or PID
             return False, False
     
-    def _kill_process_tree(self, pid):
-        """Kill a process and all its children."""
+    def _kill_process_tree(self, pid, parent_obj=None, pidfd=None):
+        """Kill a process and all its children.
+
+        Pass the cached psutil handle as parent_obj when available to avoid
+        constructing a fresh Process (and its /proc reads) per shutdown.
+        A pidfd makes the final parent kill immune to PID reuse.
+        """
         if PSUTIL_AVAILABLE:
             try:
-                parent = psutil.Process(pid)
+                parent = parent_obj if parent_obj is not None else psutil.Process(pid)
                 children = parent.children(recursive=True)
                 
                 # Log what we're about to kill
@@ -981,26 +1436,13 @@ class WorkerProcessManager:
         print(f"[Distributed] Using OS commands to kill process tree")
         if platform.system() == "Windows":
             try:
-                # Use wmic to find child processes
-                result = subprocess.run(['wmic', 'process', 'where', f'ParentProcessId={pid}', 'get', 'ProcessId'], 
-                                      capture_output=True, text=True)
-                if result.returncode == 0:
-                    lines = result.stdout.strip().split('\n')[1:]  # Skip header
-                    child_pids = [line.strip() for line in lines if line.strip() and line.strip().isdigit()]
-                    
-                    print(f"[Distributed] Found child processes: {child_pids}")
-                    
-                    # Kill each child
-                    for child_pid in child_pids:
-                        try:
-                            subprocess.run(['taskkill', '/F', '/PID', child_pid], 
-                                         capture_output=True, check=False)
-                        except:
-                            pass
-                
-                # Kill the parent with tree flag
-                result = subprocess.run(['taskkill', '/F', '/PID', str(pid), '/T'], 
-                                      capture_output=True, text=True)
+                # taskkill /T walks the process tree itself - the old wmic
+                # child enumeration (deprecated, one process spawn + WMI init
+                # per stop, text parsing) was pure overhead on top of it
+                CREATE_NO_WINDOW = 0x08000000
+                result = subprocess.run(['taskkill', '/F', '/T', '/PID', str(pid)],
+                                      capture_output=True, text=True,
+                                      creationflags=CREATE_NO_WINDOW)
                 print(f"[Distributed] Taskkill result: {result.stdout.strip()}")
                 return result.returncode == 0
             except Exception as e:
@@ -1010,9 +1452,24 @@ class WorkerProcessManager:
             # Unix: use pkill
             try:
                 subprocess.run(['pkill', '-TERM', '-P', str(pid)], check=False)
-                time.sleep(WORKER_CHECK_INTERVAL)
+                # Wait for the actual exit instead of sleeping the full
+                # interval; escalate to SIGKILL only for what's left
+                if pidfd is not None:
+                    # The pidfd becomes readable the moment the process
+                    # dies; poll() has no FD_SETSIZE ceiling
+                    poller = select.poll()
+                    poller.register(pidfd, select.POLLIN)
+                    poller.poll(int(WORKER_CHECK_INTERVAL * 1000))
+                else:
+                    deadline = time.monotonic() + WORKER_CHECK_INTERVAL
+                    while time.monotonic() < deadline and is_process_alive(pid):
+                        time.sleep(0.01)
                 subprocess.run(['pkill', '-KILL', '-P', str(pid)], check=False)
-                os.kill(pid, signal.SIGKILL)
+                if pidfd is not None:
+                    # Signal through the pidfd - can't hit a recycled PID
+                    pidfd_kill(pidfd, signal.SIGKILL)
+                else:
+                    os.kill(pid, signal.SIGKILL)
                 return True
             except:
                 return False
@@ -1024,52 +1481,57 @@ worker_manager = WorkerProcessManager()
 def auto_launch_workers():
     """Launch enabled workers if auto_launch_workers is set to true."""
     try:
-        config = load_config()
+        config = worker_manager._get_config()
         if config.get('settings', {}).get('auto_launch_workers', False):
             log("Auto-launch workers is enabled, checking for workers to start...")
-            
+
             # Clear managed_processes before launching new workers
             # This handles cases where the master was killed without proper cleanup
             if config.get('managed_processes'):
                 log("Clearing old managed_processes before auto-launch...")
                 config['managed_processes'] = {}
-                save_config(config)
+                worker_manager._save_config_cache()
             
             workers = config.get('workers', [])
-            launched_count = 0
-            
+
+            # Filter first, then launch everything concurrently - startup
+            # latency is the slowest spawn, not the sum of all of them
+            to_launch = []
             for worker in workers:
                 if worker.get('enabled', False):
                     worker_id = worker.get('id')
                     worker_name = worker.get('name', f'Worker {worker_id}')
-                    
+
                     # Skip remote workers
                     host = worker.get('host', 'localhost').lower()
                     if host not in ['localhost', '127.0.0.1', '', None]:
                         debug_log(f"Skipping remote worker {worker_name} (host: {host})")
                         continue
-                    
+
                     # Check if already running
                     if str(worker_id) in worker_manager.processes:
                         proc_info = worker_manager.processes[str(worker_id)]
                         if worker_manager._is_process_running(proc_info['pid']):
                             debug_log(f"Worker {worker_name} already running, skipping")
                             continue
-                    
-                    # Launch the worker
+
+                    to_launch.append(worker)
+
+            launched_count = 0
+            if to_launch:
+                def _launch_one(worker):
+                    worker_name = worker.get('name', f"Worker {worker.get('id')}")
                     try:
                         pid = worker_manager.launch_worker(worker)
                         log(f"Auto-launched worker {worker_name} (PID: {pid})")
-                        
-                        # Mark as launching in managed processes
-                        if str(worker_id) in worker_manager.processes:
-                            worker_manager.processes[str(worker_id)]['launching'] = True
-                            worker_manager.save_processes()
-                        
-                        launched_count += 1
+                        return 1
                     except Exception as e:
                         log(f"Failed to auto-launch worker {worker_name}: {e}")
-            
+                        return 0
+
+                with concurrent.futures.ThreadPoolExecutor(max_workers=len(to_launch)) as ex:
+                    launched_count = sum(ex.map(_launch_one, to_launch))
+
             if launched_count > 0:
                 log(f"Auto-launched {launched_count} worker(s)")
             else:
@@ -1082,10 +1544,18 @@ def auto_launch_workers():
 # Schedule auto-launch after a short delay to ensure server is ready
 def delayed_auto_launch():
     """Delay auto-launch to ensure server is fully initialized."""
-    import threading
-    timer = threading.Timer(WORKER_STARTUP_DELAY, auto_launch_workers)
-    timer.daemon = True
-    timer.start()
+    try:
+        # One-shot on the server loop: dies with the loop on shutdown and
+        # needs no dedicated sleeper thread. The launch work itself runs in
+        # the executor so the subprocess spawns can't block the loop.
+        loop = get_server_loop()
+        loop.call_later(WORKER_STARTUP_DELAY,
+                        lambda: loop.run_in_executor(None, auto_launch_workers))
+    except Exception as e:
+        debug_log(f"Could not schedule auto-launch on server loop: {e}")
+        timer = threading.Timer(WORKER_STARTUP_DELAY, auto_launch_workers)
+        timer.daemon = True
+        timer.start()
 
 # Call delayed auto-launch only if we're the master (not a worker)
 if not os.environ.get('COMFYUI_MASTER_PID'):
@@ -1097,14 +1567,14 @@ else:
 def cleanup_on_exit(signum=None, frame=None):
     """Handle cleanup on exit or signal"""
     try:
-        config = load_config()
+        config = worker_manager._get_config()
         if config.get('settings', {}).get('stop_workers_on_master_exit', True):
             print("\n[Distributed] Master shutting down, stopping all managed workers...")
             worker_manager.cleanup_all()
         else:
             print("\n[Distributed] Master shutting down, workers will continue running")
-            # Still save the current state
-            worker_manager.save_processes()
+            # Still save the current state - write immediately, we're exiting
+            worker_manager.flush_processes()
     except Exception as e:
         print(f"[Distributed] Error during cleanup: {e}")
 
@@ -1132,46 +1602,286 @@ if not hasattr(prompt_server, 'distributed_pending_jobs'):
     prompt_server.distributed_pending_jobs = {}
     prompt_server.distributed_jobs_lock = asyncio.Lock()
 
+# Formats browsers decode natively - served as original bytes, no re-encode
+_IMAGE_MIME_TYPES = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.webp': 'image/webp',
+}
+
+def _encode_image_for_transfer(full_path, normalize=False):
+    """Blocking helper: return a base64 data URL for an image file.
+
+    Known web formats are passed through untouched - decoding and
+    re-compressing them to PNG was pure CPU waste. Everything else (or an
+    explicit normalize request) still goes through the PIL -> PNG path.
+    """
+    ext = os.path.splitext(full_path)[1].lower()
+    mime = _IMAGE_MIME_TYPES.get(ext)
+
+    if mime is not None and not normalize:
+        with open(full_path, 'rb') as f:
+            raw = f.read()
+    else:
+        with Image.open(full_path) as img:
+            # Convert to RGB if needed
+            if img.mode not in ('RGB', 'RGBA'):
+                img = img.convert('RGB')
+            buffer = io.BytesIO()
+            img.save(buffer, format='PNG', compress_level=1)  # Fast compression
+            raw = buffer.getvalue()
+        mime = 'image/png'
+
+    return f"data:{mime};base64,{base64.b64encode(raw).decode('utf-8')}"
+
 @server.PromptServer.instance.routes.post("/distributed/load_image")
 async def load_image_endpoint(request):
     """Load an image file and return it as base64 data."""
     try:
         data = await request.json()
         image_path = data.get("image_path")
-        
+
         if not image_path:
             return await handle_api_error(request, "Missing image_path", 400)
-        
-        import folder_paths
-        import base64
-        from PIL import Image
-        import io
-        
+
         # Use ComfyUI's folder paths to find the image
         full_path = folder_paths.get_annotated_filepath(image_path)
-        
+
         if not os.path.exists(full_path):
             return await handle_api_error(request, f"Image not found: {image_path}", 404)
-        
-        # Load and convert to base64
-        with Image.open(full_path) as img:
-            # Convert to RGB if needed
-            if img.mode not in ('RGB', 'RGBA'):
-                img = img.convert('RGB')
-            
-            # Save to bytes
-            buffer = io.BytesIO()
-            img.save(buffer, format='PNG', compress_level=1)  # Fast compression
-            img_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-        
+
+        loop = asyncio.get_running_loop()
+        image_data = await loop.run_in_executor(
+            None, _encode_image_for_transfer, full_path, bool(data.get("normalize", False))
+        )
+
         return web.json_response({
             "status": "success",
-            "image_data": f"data:image/png;base64,{img_base64}"
+            "image_data": image_data
         })
-        
+
     except Exception as e:
         return await handle_api_error(request, e, 500)
 
+# Pool for PIL encode/decode so image codec work never blocks the event
+# loop; sized small since each job is CPU-bound for milliseconds.
+_img_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="distributed-img"
+)
+
+def _decode_image_to_tensor(img_data):
+    """Decode compressed image bytes to a contiguous float tensor (blocking).
+
+    Goes straight from PIL to a uint8 NumPy array and scales in one
+    in-place pass, skipping pil_to_tensor's intermediate float copy.
+    """
+    img = Image.open(io.BytesIO(img_data))
+    img.draft('RGB', img.size)  # Fast path for JPEG; no-op for PNG
+    arr = np.asarray(img.convert('RGB'), dtype=np.uint8)
+    tensor = torch.from_numpy(arr).unsqueeze(0).float().div_(255.0)
+    return ensure_contiguous(tensor)
+
+def _encode_tensor_to_png(image_tensor):
+    """Encode a [1,H,W,C] tensor as uncompressed PNG bytes (blocking)."""
+    img = tensor_to_pil(image_tensor, 0)
+    byte_io = io.BytesIO()
+    # Use PNG with no compression for lossless transfer
+    img.save(byte_io, format='PNG', compress_level=0)
+    byte_io.seek(0)
+    return byte_io
+
+# --- Raw tensor transport ---
+# PNG encode+decode on both ends was the dominant CPU cost of distributed
+# collection; raw bytes plus a tiny shape/dtype header reduce it to a memcpy.
+
+def _tensor_to_raw_bytes(image_tensor, transport_dtype='uint8'):
+    """Serialize a [B,H,W,C] image tensor for transport.
+
+    uint8 quantizes display-range images to a quarter of the fp32 payload
+    with no visible loss; fp16/bf16/fp32 keep float precision at increasing
+    bandwidth cost. Returns (payload, shape_str, dtype_str).
+    """
+    if transport_dtype == 'uint8':
+        arr = (image_tensor.clamp(0, 1) * 255).round().to(torch.uint8).contiguous().cpu().numpy()
+        dtype_str = 'uint8'
+    elif transport_dtype == 'fp16':
+        arr = image_tensor.to(torch.float16).contiguous().cpu().numpy()
+        dtype_str = 'float16'
+    elif transport_dtype == 'bf16':
+        # NumPy has no bfloat16 - ship the raw 16-bit pattern. int16 rather
+        # than uint16: the bytes are identical and torch.uint16 views only
+        # exist from torch 2.3 onward.
+        arr = image_tensor.to(torch.bfloat16).contiguous().cpu().view(torch.int16).numpy()
+        dtype_str = 'bfloat16'
+    else:
+        arr = image_tensor.float().contiguous().cpu().numpy()
+        dtype_str = 'float32'
+    shape_str = ','.join(str(d) for d in image_tensor.shape)
+    return arr.tobytes(), shape_str, dtype_str
+
+# Cached on the config file's mtime like is_debug_enabled - this runs per
+# send and must not re-read the config on the event loop every time
+_transport_codec_cache = {"mtime": None, "value": 'none'}
+
+def _transport_compression():
+    """Requested transport codec from settings, limited to what's installed."""
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except OSError:
+        return 'none'
+    if mtime != _transport_codec_cache["mtime"]:
+        try:
+            codec = load_config().get('settings', {}).get('transport_compression', 'none')
+        except Exception:
+            codec = 'none'
+        if codec == 'zstd' and not ZSTD_AVAILABLE:
+            codec = 'none'
+        if codec == 'lz4' and not LZ4_AVAILABLE:
+            codec = 'none'
+        _transport_codec_cache["mtime"] = mtime
+        _transport_codec_cache["value"] = codec
+    return _transport_codec_cache["value"]
+
+def _compress_payload(payload, codec):
+    """Compress raw tensor bytes with a fast codec. Returns (payload, codec)."""
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=1).compress(payload), 'zstd'
+    if codec == 'lz4':
+        return lz4_frame.compress(payload), 'lz4'
+    return payload, 'none'
+
+def _decompress_payload(payload, codec):
+    """Inverse of _compress_payload on the receiving side."""
+    if codec == 'zstd':
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("worker sent zstd-compressed data but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(payload)
+    if codec == 'lz4':
+        if not LZ4_AVAILABLE:
+            raise RuntimeError("worker sent lz4-compressed data but lz4 is not installed")
+        return lz4_frame.decompress(payload)
+    return payload
+
+def _serialize_tensor_for_transport(image_tensor, transport_dtype):
+    """Serialize and optionally compress a tensor for upload (blocking).
+
+    Run off-loop via _img_executor: .cpu() forces a device sync and the
+    quantize/compress of a multi-megabyte batch would otherwise stall the
+    worker's event loop for the duration.
+    """
+    payload, shape_str, dtype_str = _tensor_to_raw_bytes(image_tensor, transport_dtype)
+    payload, codec = _compress_payload(payload, _transport_compression())
+    return payload, shape_str, dtype_str, codec
+
+def _decode_raw_upload(buf, compression, shape, dtype):
+    """Decompress and rebuild one uploaded tensor (blocking; run off-loop).
+
+    Handlers run this via asyncio.to_thread, so dtype conversion for
+    several workers' uploads proceeds in parallel instead of serializing
+    on the event loop.
+    """
+    return _raw_bytes_to_tensor(_decompress_payload(buf, compression), shape, dtype)
+
+def _raw_bytes_to_tensor(buf, shape, dtype):
+    """Rebuild a float image tensor from raw transport bytes."""
+    if dtype == 'uint8':
+        arr = np.frombuffer(buf, dtype=np.uint8).reshape(shape)
+        return torch.from_numpy(arr.copy()).float().div_(255.0)
+    if dtype == 'bfloat16':
+        arr = np.frombuffer(buf, dtype=np.int16).reshape(shape)
+        return torch.from_numpy(arr.copy()).view(torch.bfloat16).float()
+    arr = np.frombuffer(buf, dtype=np.dtype(dtype)).reshape(shape)
+    return torch.from_numpy(arr.copy()).float()
+
+@server.PromptServer.instance.routes.post("/distributed/job_complete_raw")
+async def job_complete_raw_endpoint(request):
+    """Receive a worker result as a raw tensor (no image codec involved)."""
+    try:
+        data = await request.post()
+        multi_job_id = data.get('multi_job_id')
+        worker_id = data.get('worker_id')
+        image_index = data.get('image_index')
+        is_last = data.get('is_last', 'False').lower() == 'true'
+        shape_field = data.get('shape')
+        dtype_field = data.get('dtype', 'uint8')
+        compression = data.get('compression', 'none')
+        blob = data.get('data')
+
+        debug_log(f"job_complete_raw received - job_id: {multi_job_id}, worker: {worker_id}, index: {image_index}, is_last: {is_last}")
+
+        if not all([multi_job_id, shape_field, blob]):
+            return await handle_api_error(request, "Missing job_id or tensor data", 400)
+
+        try:
+            shape = tuple(int(dim) for dim in shape_field.split(','))
+            # from_numpy output is contiguous by construction - no fix-up
+            tensor = await asyncio.to_thread(
+                _decode_raw_upload, blob.file.read(), compression, shape, dtype_field)
+        except Exception as e:
+            log(f"Error processing raw tensor from worker {worker_id}: {e}")
+            return await handle_api_error(request, f"Tensor processing error: {e}", 400)
+
+        async with prompt_server.distributed_jobs_lock:
+            if multi_job_id in prompt_server.distributed_pending_jobs:
+                await prompt_server.distributed_pending_jobs[multi_job_id].put({
+                    'tensor': tensor,
+                    'worker_id': str(worker_id),
+                    'image_index': int(image_index) if image_index else 0,
+                    'is_last': is_last
+                })
+                return web.json_response({"status": "success"})
+            else:
+                log(f"ERROR: Job {multi_job_id} not found in distributed_pending_jobs")
+                return await handle_api_error(request, "Job not found or already complete", 404)
+    except Exception as e:
+        return await handle_api_error(request, e)
+
+
+@server.PromptServer.instance.routes.post("/distributed/job_complete_batch")
+async def job_complete_batch_endpoint(request):
+    """Receive a worker's entire result batch as one raw tensor POST."""
+    try:
+        data = await request.post()
+        multi_job_id = data.get('multi_job_id')
+        worker_id = data.get('worker_id')
+        shape_field = data.get('shape')
+        dtype_field = data.get('dtype', 'uint8')
+        compression = data.get('compression', 'none')
+        blob = data.get('data')
+
+        debug_log(f"job_complete_batch received - job_id: {multi_job_id}, worker: {worker_id}, shape: {shape_field}")
+
+        if not all([multi_job_id, shape_field, blob]):
+            return await handle_api_error(request, "Missing job_id or tensor data", 400)
+
+        try:
+            shape = tuple(int(dim) for dim in shape_field.split(','))
+            # from_numpy output is contiguous by construction - no fix-up
+            tensor = await asyncio.to_thread(
+                _decode_raw_upload, blob.file.read(), compression, shape, dtype_field)
+        except Exception as e:
+            log(f"Error processing batch tensor from worker {worker_id}: {e}")
+            return await handle_api_error(request, f"Tensor processing error: {e}", 400)
+
+        async with prompt_server.distributed_jobs_lock:
+            if multi_job_id in prompt_server.distributed_pending_jobs:
+                # One queue item carries the whole [B,H,W,C] batch; torch.cat
+                # at combine time treats it the same as per-image tensors.
+                await prompt_server.distributed_pending_jobs[multi_job_id].put({
+                    'tensor': tensor,
+                    'worker_id': str(worker_id),
+                    'image_index': 0,
+                    'is_last': True
+                })
+                return web.json_response({"status": "success"})
+            else:
+                log(f"ERROR: Job {multi_job_id} not found in distributed_pending_jobs")
+                return await handle_api_error(request, "Job not found or already complete", 404)
+    except Exception as e:
+        return await handle_api_error(request, e)
+
+
 @server.PromptServer.instance.routes.post("/distributed/job_complete")
 async def job_complete_endpoint(request):
     try:
@@ -1187,14 +1897,12 @@ async def job_complete_endpoint(request):
         if not all([multi_job_id, image_file]):
             return await handle_api_error(request, "Missing job_id or image data", 400)
 
-        # Process image with error handling
+        # Process image with error handling; decode runs in the image pool
+        # so a slow PNG doesn't stall other workers' uploads
         try:
             img_data = image_file.file.read()
-            img = Image.open(io.BytesIO(img_data)).convert("RGB")
-            # Convert to tensor using utility function
-            tensor = pil_to_tensor(img)
-            # Ensure tensor is contiguous
-            tensor = ensure_contiguous(tensor)
+            tensor = await asyncio.get_running_loop().run_in_executor(
+                _img_executor, _decode_image_to_tensor, img_data)
         except Exception as e:
             log(f"Error processing image from worker {worker_id}: {e}")
             return await handle_api_error(request, f"Image processing error: {e}", 400)
@@ -1204,7 +1912,7 @@ async def job_complete_endpoint(request):
             if multi_job_id in prompt_server.distributed_pending_jobs:
                 await prompt_server.distributed_pending_jobs[multi_job_id].put({
                     'tensor': tensor,
-                    'worker_id': worker_id,
+                    'worker_id': str(worker_id),
                     'image_index': int(image_index) if image_index else 0,
                     'is_last': is_last
                 })
@@ -1218,8 +1926,38 @@ async def job_complete_endpoint(request):
         return await handle_api_error(request, e)
 
 
+async def _is_missing_route(response):
+    """Tell a routing 404 (master doesn't have this endpoint) apart from the
+    endpoint's own job-not-found 404.
+
+    Our job endpoints answer 404 with a JSON body mentioning the job;
+    aiohttp's router answers with its plain "404: Not Found" page. Without
+    the distinction a stale job would be misread as version skew and walk
+    every fallback transport for nothing.
+    """
+    try:
+        text = await response.text()
+    except Exception:
+        return True
+    return "Job not found" not in text
+
+
 # --- Collector Node ---
 class DistributedCollectorNode:
+    # Dedicated CUDA stream for collection copies so worker-row transfers
+    # overlap whatever the default stream is still computing
+    _collect_stream = None
+
+    # Row-layout tables keyed by (worker ids, master batch, worker batch) -
+    # invariant across jobs for a fixed configuration, so build them once
+    _layout_cache = {}
+
+    @classmethod
+    def _get_collect_stream(cls):
+        if cls._collect_stream is None:
+            cls._collect_stream = torch.cuda.Stream()
+        return cls._collect_stream
+
     @classmethod
     def INPUT_TYPES(s):
         return {
@@ -1232,6 +1970,7 @@ class DistributedCollectorNode:
                 "worker_batch_size": ("INT", {"default": 1, "min": 1, "max": 1024}),
                 "worker_id": ("STRING", {"default": ""}),
                 "pass_through": ("BOOLEAN", {"default": False}),
+                "transport_dtype": ("STRING", {"default": "uint8"}),
             },
         }
 
@@ -1239,7 +1978,7 @@ class DistributedCollectorNode:
     FUNCTION = "run"
     CATEGORY = "image"
     
-    def run(self, images, multi_job_id="", is_worker=False, master_url="", enabled_worker_ids="[]", worker_batch_size=1, worker_id="", pass_through=False):
+    def run(self, images, multi_job_id="", is_worker=False, master_url="", enabled_worker_ids="[]", worker_batch_size=1, worker_id="", pass_through=False, transport_dtype="uint8"):
         if not multi_job_id or pass_through:
             if pass_through:
                 print(f"[Distributed Collector] Pass-through mode enabled, returning images unchanged")
@@ -1247,23 +1986,95 @@ class DistributedCollectorNode:
 
         # Use async helper to run in server loop
         result = run_async_in_server_loop(
-            self.execute(images, multi_job_id, is_worker, master_url, enabled_worker_ids, worker_batch_size, worker_id)
+            self.execute(images, multi_job_id, is_worker, master_url, enabled_worker_ids, worker_batch_size, worker_id, transport_dtype)
         )
         return result
 
-    async def send_image_to_master(self, image_tensor, multi_job_id, master_url, image_index, worker_id, is_last=False):
-        """Helper method to send a single image to the master"""
+    async def send_batch_to_master(self, images, multi_job_id, master_url, worker_id, transport_dtype="uint8"):
+        """Send the whole result batch to the master in one POST.
+
+        One request instead of N removes the per-image HTTP overhead and lets
+        the kernel stream a single large payload. Returns False if the master
+        doesn't expose the batch endpoint so the caller can fall back to
+        per-image sends.
+        """
+        payload, shape_str, dtype_str, codec = await asyncio.get_running_loop().run_in_executor(
+            _img_executor, _serialize_tensor_for_transport, images, transport_dtype)
+
+        data = aiohttp.FormData()
+        data.add_field('multi_job_id', multi_job_id)
+        data.add_field('worker_id', str(worker_id))
+        data.add_field('count', str(images.shape[0]))
+        data.add_field('shape', shape_str)
+        data.add_field('dtype', dtype_str)
+        data.add_field('compression', codec)
+        data.add_field('data', payload, filename='batch.raw', content_type='application/octet-stream')
+
+        try:
+            session = await get_client_session()
+            async with session.post(f"{master_url}/distributed/job_complete_batch", data=data) as response:
+                if response.status == 404:
+                    if not await _is_missing_route(response):
+                        log(f"Worker - Job {multi_job_id} no longer pending on master, dropping batch")
+                        return True
+                    # Master predates the batch endpoint
+                    debug_log("Worker - Batch transport unavailable, falling back to per-image sends")
+                    return False
+                response.raise_for_status()
+                return True
+        except Exception as e:
+            # Retrying per-image is safe even if the batch partially landed:
+            # the master places rows by index, so a duplicate is an overwrite
+            log(f"Worker - Failed to send batch to master, falling back to per-image sends: {e}")
+            return False
+
+    async def send_image_to_master(self, image_tensor, multi_job_id, master_url, image_index, worker_id, is_last=False, transport_dtype="uint8"):
+        """Helper method to send a single image to the master as a raw tensor.
+
+        Falls back to the PNG transport if the master doesn't expose the raw
+        endpoint (version skew during upgrades).
+        """
+        if image_tensor.dim() == 3:  # Single image without batch dimension
+            image_tensor = image_tensor.unsqueeze(0)
+
+        payload, shape_str, dtype_str, codec = await asyncio.get_running_loop().run_in_executor(
+            _img_executor, _serialize_tensor_for_transport, image_tensor, transport_dtype)
+
+        data = aiohttp.FormData()
+        data.add_field('multi_job_id', multi_job_id)
+        data.add_field('worker_id', str(worker_id))
+        data.add_field('image_index', str(image_index))
+        data.add_field('is_last', str(is_last))
+        data.add_field('shape', shape_str)
+        data.add_field('dtype', dtype_str)
+        data.add_field('compression', codec)
+        data.add_field('data', payload, filename=f'image_{image_index}.raw', content_type='application/octet-stream')
+
+        try:
+            session = await get_client_session()
+            async with session.post(f"{master_url}/distributed/job_complete_raw", data=data) as response:
+                if response.status == 404:
+                    if not await _is_missing_route(response):
+                        log(f"Worker - Job {multi_job_id} no longer pending on master, dropping image {image_index}")
+                        return
+                    # Master predates the raw endpoint - retry with PNG
+                    debug_log(f"Worker - Raw transport unavailable, falling back to PNG for image {image_index}")
+                    await self.send_image_png_to_master(image_tensor, multi_job_id, master_url, image_index, worker_id, is_last)
+                    return
+                response.raise_for_status()
+        except Exception as e:
+            log(f"Worker - Failed to send image {image_index+1} to master: {e}")
+
+    async def send_image_png_to_master(self, image_tensor, multi_job_id, master_url, image_index, worker_id, is_last=False):
+        """Legacy PNG transport, kept for masters without the raw endpoint."""
         # Ensure we handle the tensor shape correctly (H, W, C)
-        if image_tensor.dim() == 4:  # Has batch dimension
-            img = tensor_to_pil(image_tensor, 0)
-        else:  # Single image without batch dimension
+        if image_tensor.dim() == 3:  # Single image without batch dimension
             # Add batch dimension temporarily for tensor_to_pil
-            img = tensor_to_pil(image_tensor.unsqueeze(0), 0)
-        byte_io = io.BytesIO()
-        # Use PNG with no compression for lossless transfer
-        img.save(byte_io, format='PNG', compress_level=0)
-        byte_io.seek(0)
-        
+            image_tensor = image_tensor.unsqueeze(0)
+        # Encode in the image pool so the event loop stays free for other sends
+        byte_io = await asyncio.get_running_loop().run_in_executor(
+            _img_executor, _encode_tensor_to_png, image_tensor)
+
         data = aiohttp.FormData()
         data.add_field('multi_job_id', multi_job_id)
         data.add_field('worker_id', str(worker_id))
@@ -1278,16 +2089,29 @@ class DistributedCollectorNode:
         except Exception as e:
             log(f"Worker - Failed to send image {image_index+1} to master: {e}")
 
-    async def execute(self, images, multi_job_id="", is_worker=False, master_url="", enabled_worker_ids="[]", worker_batch_size=1, worker_id=""):
+    async def execute(self, images, multi_job_id="", is_worker=False, master_url="", enabled_worker_ids="[]", worker_batch_size=1, worker_id="", transport_dtype="uint8"):
         if is_worker:
             # Worker mode: send images to master
             debug_log(f"Worker - Job {multi_job_id} complete. Sending {images.shape[0]} image(s) to master")
-            
-            # Send all images, marking the last one
-            for i in range(images.shape[0]):
-                is_last = (i == images.shape[0] - 1)
-                await self.send_image_to_master(images[i], multi_job_id, master_url, i, worker_id, is_last)
-            
+
+            # Prefer one POST for the whole batch; fall back to per-image
+            # sends if the master is older, marking the last one
+            sent = await self.send_batch_to_master(images, multi_job_id, master_url, worker_id, transport_dtype)
+            if not sent:
+                # Overlap uploads so serialization on one image hides the
+                # network round-trip of another; the final image is sent
+                # alone afterwards so its is_last flag can't arrive early.
+                num_images = images.shape[0]
+                sem = asyncio.Semaphore(WORKER_UPLOAD_CONCURRENCY)
+
+                async def _send_one(i):
+                    async with sem:
+                        await self.send_image_to_master(images[i], multi_job_id, master_url, i, worker_id, False, transport_dtype)
+
+                if num_images > 1:
+                    await asyncio.gather(*[_send_one(i) for i in range(num_images - 1)])
+                await self.send_image_to_master(images[num_images - 1], multi_job_id, master_url, num_images - 1, worker_id, True, transport_dtype)
+
             return (images,)
         else:
             # Master mode: collect images from workers
@@ -1295,166 +2119,207 @@ class DistributedCollectorNode:
             num_workers = len(enabled_workers)
             if num_workers == 0:
                 return (images,)
+
+            # Queue items carry string worker ids (HTTP form fields), so
+            # build the expected set in that domain once instead of
+            # restringifying every id on each timeout wake
+            expected_worker_ids = frozenset(str(w) for w in enabled_workers)
             
-            images_on_cpu = images.cpu()
+            # Keep master images on their own device - forcing .cpu() here
+            # cost a full device-to-host copy per job, only for downstream
+            # nodes to upload the combined batch right back to the GPU.
+            # Worker tensors arrive on CPU and copy_ handles the H2D hop.
+            # No contiguity fix-up needed either: copy_ reads strided
+            # sources, and the preallocated output is contiguous by birth.
+            master_images = images
             master_batch_size = images.shape[0]
             debug_log(f"Master - Job {multi_job_id}: Master has {master_batch_size} images, collecting from {num_workers} workers...")
-            
-            # Ensure master images are contiguous
-            images_on_cpu = ensure_contiguous(images_on_cpu)
-            
+
             # Debug: Check master tensor properties
-            debug_log(f"Master tensor - shape: {images_on_cpu.shape}, dtype: {images_on_cpu.dtype}, device: {images_on_cpu.device}")
-            
-            # Initialize storage for collected images
-            worker_images = {}  # Dict to store images by worker_id and index
+            debug_log(f"Master tensor - shape: {master_images.shape}, dtype: {master_images.dtype}, device: {master_images.device}")
+
+            # Preallocate the combined output and copy rows straight into it
+            # as they arrive - no per-worker dict bookkeeping and no final
+            # torch.cat over a pile of small tensors. Row layout matches the
+            # seed distribution pattern: master rows first, then each
+            # worker's rows in enabled_workers order.
+            total_expected = master_batch_size + num_workers * worker_batch_size
+            # When the combined batch is assembled on the CPU but a GPU is
+            # present, pin the buffer: downstream .to('cuda') then runs as a
+            # fast async DMA instead of a pageable synchronous copy.
+            # Note on layout: ComfyUI IMAGE tensors are logically [B,H,W,C],
+            # so plain contiguous already interleaves channels innermost -
+            # the physical layout torch.channels_last would produce for an
+            # NCHW tensor. Don't tag channels_last here; that memory format
+            # is defined for logical NCHW and would misinterpret these dims.
+            pin = master_images.device.type == 'cpu' and torch.cuda.is_available()
+            out = torch.empty((total_expected,) + tuple(master_images.shape[1:]),
+                              dtype=master_images.dtype, device=master_images.device,
+                              pin_memory=pin)
+            out[:master_batch_size].copy_(master_images, non_blocking=True)
+            # Keyed on the ordered id tuple - row offsets follow list order
+            layout_key = (tuple(str(w) for w in enabled_workers), master_batch_size, worker_batch_size)
+            worker_base = self._layout_cache.get(layout_key)
+            if worker_base is None:
+                worker_base = {str(wid): master_batch_size + i * worker_batch_size
+                               for i, wid in enumerate(enabled_workers)}
+                self._layout_cache[layout_key] = worker_base
+            filled_rows = set()
+
+            # Issue worker-row copies on a side stream so they overlap any
+            # master compute still running on the default stream
+            collect_stream = self._get_collect_stream() if out.is_cuda else None
+
+            def _place(worker_id, image_index, tensor):
+                """Copy one received tensor into its output rows."""
+                base = worker_base.get(str(worker_id))
+                if base is None:
+                    log(f"Master - Ignoring result from unknown worker {worker_id}")
+                    return
+                if tensor.dim() == 3:
+                    tensor = tensor.unsqueeze(0)
+                start = base + image_index
+                stop = start + tensor.shape[0]
+                # Clamp to this worker's own slice - image_index comes off
+                # the wire, and an out-of-range value must not overwrite
+                # rows belonging to another worker
+                if (image_index < 0 or stop > base + worker_batch_size
+                        or tensor.shape[1:] != out.shape[1:]):
+                    log(f"Master - Result from worker {worker_id} (index {image_index}, "
+                        f"{tensor.shape[0]} rows) doesn't fit its slice, skipping")
+                    return
+                # Async where the device allows it; one synchronize below
+                # settles all in-flight copies at once
+                if collect_stream is not None:
+                    with torch.cuda.stream(collect_stream):
+                        out[start:stop].copy_(tensor, non_blocking=True)
+                else:
+                    out[start:stop].copy_(tensor, non_blocking=True)
+                filled_rows.update(range(start, stop))
             
-            # Get the existing queue - it should already exist from prepare_job
+            # Get the existing queue - it should already exist from prepare_job.
+            # The lock is only needed for creation; the queue reference itself
+            # never changes for the lifetime of the job, so the hot loop below
+            # works on a cached reference with no per-item lock traffic.
             async with prompt_server.distributed_jobs_lock:
-                if multi_job_id not in prompt_server.distributed_pending_jobs:
+                q = prompt_server.distributed_pending_jobs.get(multi_job_id)
+                if q is None:
                     log(f"Master - WARNING: Queue doesn't exist for job {multi_job_id}, creating one")
-                    prompt_server.distributed_pending_jobs[multi_job_id] = asyncio.Queue()
+                    q = asyncio.Queue()
+                    prompt_server.distributed_pending_jobs[multi_job_id] = q
                 else:
-                    existing_size = prompt_server.distributed_pending_jobs[multi_job_id].qsize()
-                    debug_log(f"Master - Using existing queue for job {multi_job_id} (current size: {existing_size})")
-            
+                    debug_log(f"Master - Using existing queue for job {multi_job_id} (current size: {q.qsize()})")
+
             # Collect images until all workers report they're done
             collected_count = 0
             workers_done = set()
-            
+
             # Use a reasonable timeout for the first image
             timeout = WORKER_JOB_TIMEOUT
-            
+
             debug_log(f"Master - Starting collection loop, expecting {num_workers} workers")
-            
-            # Get queue size before starting
-            async with prompt_server.distributed_jobs_lock:
-                q = prompt_server.distributed_pending_jobs[multi_job_id]
-                initial_size = q.qsize()
-            debug_log(f"Master - Queue size before collection: {initial_size}")
-            
+
+            # Check once per job: skips the per-item f-string interpolation
+            # (and qsize reads) entirely when debug is off
+            debug_enabled = is_debug_enabled()
+
+            # Bind per-item callables to locals; the loop runs once per
+            # received image and LOAD_ATTR per iteration adds up
+            _wait_for = asyncio.wait_for
+            _q_get = q.get
+
             while len(workers_done) < num_workers:
                 try:
-                    # Get the queue again each time to ensure we have the right reference
-                    async with prompt_server.distributed_jobs_lock:
-                        q = prompt_server.distributed_pending_jobs[multi_job_id]
-                        current_size = q.qsize()
-                    
-                    debug_log(f"Master - Waiting for queue item, timeout={timeout}s, queue size={current_size}")
-                    
-                    result = await asyncio.wait_for(q.get(), timeout=timeout)
+                    if debug_enabled:
+                        # qsize() is safe to read lock-free on an asyncio.Queue
+                        debug_log(f"Master - Waiting for queue item, timeout={timeout}s, queue size={q.qsize()}")
+
+                    result = await _wait_for(_q_get(), timeout=timeout)
                     worker_id = result['worker_id']
                     image_index = result['image_index']
                     tensor = result['tensor']
                     is_last = result.get('is_last', False)
                     
-                    debug_log(f"Master - Got result from worker {worker_id}, image {image_index}, is_last={is_last}")
-                    
-                    if worker_id not in worker_images:
-                        worker_images[worker_id] = {}
-                    worker_images[worker_id][image_index] = tensor
-                    
+                    if debug_enabled:
+                        debug_log(f"Master - Got result from worker {worker_id}, image {image_index}, is_last={is_last}")
+
+                    _place(worker_id, image_index, tensor)
+
                     # Debug: Check worker tensor properties
                     if collected_count == 0:  # Only print once
                         debug_log(f"Master - Worker tensor - shape: {tensor.shape}, dtype: {tensor.dtype}, device: {tensor.device}")
-                    
+
                     collected_count += 1
-                    
+
                     # Once we start receiving images, use shorter timeout
                     timeout = WORKER_JOB_TIMEOUT
-                    
+
                     if is_last:
                         workers_done.add(worker_id)
-                        debug_log(f"Master - Worker {worker_id} done. Collected {len(worker_images[worker_id])} images")
-                    else:
+                        if debug_enabled:
+                            debug_log(f"Master - Worker {worker_id} done")
+                    elif debug_enabled:
                         debug_log(f"Master - Collected image {image_index + 1} from worker {worker_id}")
-                    
+
                 except asyncio.TimeoutError:
-                    missing_workers = set(str(w) for w in enabled_workers) - workers_done
+                    missing_workers = expected_worker_ids - workers_done
                     log(f"Master - Timeout. Still waiting for workers: {list(missing_workers)}")
                     
-                    # Check queue size again with lock
-                    async with prompt_server.distributed_jobs_lock:
-                        if multi_job_id in prompt_server.distributed_pending_jobs:
-                            final_q = prompt_server.distributed_pending_jobs[multi_job_id]
-                            final_size = final_q.qsize()
-                            debug_log(f"Master - Queue size at timeout: {final_size}")
-                            
-                            # Try to drain any remaining items
-                            remaining_items = []
-                            while not final_q.empty():
-                                try:
-                                    item = final_q.get_nowait()
-                                    remaining_items.append(item)
-                                except asyncio.QueueEmpty:
-                                    break
-                            
-                            if remaining_items:
-                                debug_log(f"Master - Found {len(remaining_items)} items in queue after timeout!")
-                                # Process them
-                                for item in remaining_items:
-                                    worker_id = item['worker_id']
-                                    image_index = item['image_index']
-                                    tensor = item['tensor']
-                                    is_last = item.get('is_last', False)
-                                    
-                                    if worker_id not in worker_images:
-                                        worker_images[worker_id] = {}
-                                    worker_images[worker_id][image_index] = tensor
-                                    
-                                    collected_count += 1
-                                    
-                                    if is_last:
-                                        workers_done.add(worker_id)
-                                        debug_log(f"Master - Worker {worker_id} done (found in timeout drain)")
-                        else:
-                            log(f"Master - Queue {multi_job_id} no longer exists!")
+                    # Drain any stragglers from the cached queue reference
+                    debug_log(f"Master - Queue size at timeout: {q.qsize()}")
+                    remaining_items = []
+                    while True:
+                        try:
+                            remaining_items.append(q.get_nowait())
+                        except asyncio.QueueEmpty:
+                            break
+
+                    if remaining_items:
+                        debug_log(f"Master - Found {len(remaining_items)} items in queue after timeout!")
+                        # Process them
+                        for item in remaining_items:
+                            worker_id = item['worker_id']
+                            _place(worker_id, item['image_index'], item['tensor'])
+
+                            collected_count += 1
+
+                            if item.get('is_last', False):
+                                workers_done.add(worker_id)
+                                debug_log(f"Master - Worker {worker_id} done (found in timeout drain)")
                     break
             
-            total_collected = sum(len(imgs) for imgs in worker_images.values())
-            debug_log(f"Master - Collection complete. Received {total_collected} images from {len(workers_done)} workers")
+            debug_log(f"Master - Collection complete. Received {len(filled_rows)} worker images from {len(workers_done)} workers")
             debug_log(f"Master - Workers done: {workers_done}, Enabled workers: {enabled_workers}")
-            debug_log(f"Master - Worker images keys: {list(worker_images.keys())}")
-            
-            # Clean up job queue
+
+            if collect_stream is not None:
+                # Settle every non_blocking row copy in one wait instead of
+                # paying a device sync per transfer
+                collect_stream.synchronize()
+
+            # Clean up job queue - one atomic pop keeps the lock window minimal
             async with prompt_server.distributed_jobs_lock:
-                if multi_job_id in prompt_server.distributed_pending_jobs:
-                    del prompt_server.distributed_pending_jobs[multi_job_id]
+                prompt_server.distributed_pending_jobs.pop(multi_job_id, None)
 
-            # Reorder images according to seed distribution pattern
-            # Pattern: master img 1, master img 2, worker 1 img 1, worker 1 img 2, worker 2 img 1, worker 2 img 2, etc.
-            ordered_tensors = []
-            
-            # Add master images first
-            for i in range(master_batch_size):
-                ordered_tensors.append(images_on_cpu[i:i+1])
-            
-            # Add worker images in order
-            # The worker IDs in worker_images are already strings (e.g., "1", "2")
-            # Just iterate through what we actually received
-            for worker_id_str in sorted(worker_images.keys()):
-                # Sort by image index for each worker
-                for idx in sorted(worker_images[worker_id_str].keys()):
-                    ordered_tensors.append(worker_images[worker_id_str][idx])
-            
-            # Ensure all tensors are on CPU and properly formatted before concatenation
-            cpu_tensors = []
-            for t in ordered_tensors:
-                if t.is_cuda:
-                    t = t.cpu()
-                # Ensure tensor is contiguous in memory
-                t = ensure_contiguous(t)
-                cpu_tensors.append(t)
-            
+            # Nothing arrived (all workers timed out or errored) - hand the
+            # original batch back untouched instead of gathering a copy of it
+            if not filled_rows:
+                return (images,)
+
+            # Rows were copied into their final positions on receipt, so the
+            # full case needs no reordering pass at all. If a worker never
+            # delivered, compact to just the rows that hold real data.
             try:
-                combined = torch.cat(cpu_tensors, dim=0)
-                # Ensure the combined tensor is contiguous and properly formatted
-                combined = ensure_contiguous(combined)
+                if len(filled_rows) == total_expected - master_batch_size:
+                    combined = out
+                else:
+                    keep = torch.tensor(list(range(master_batch_size)) + sorted(filled_rows),
+                                        dtype=torch.long, device=out.device)
+                    # One vectorized gather kernel; the result is contiguous
+                    combined = out.index_select(0, keep)
                 debug_log(f"Master - Job {multi_job_id} complete. Combined {combined.shape[0]} images total (master: {master_batch_size}, workers: {combined.shape[0] - master_batch_size})")
                 return (combined,)
             except Exception as e:
                 log(f"Master - Error combining images: {e}")
-                debug_log(f"Master - Tensor shapes: {[t.shape for t in cpu_tensors]}")
                 # Return just the master images as fallback
                 return (images,)
 
@@ -1486,6 +2351,9 @@ class DistributedSeed:
     RETURN_TYPES = ("INT",)
     RETURN_NAMES = ("seed",)
     FUNCTION = "distribute"
+
+    # Memoized worker_id -> index parses; shared across instances
+    _worker_idx_cache = {}
     CATEGORY = "utils"
     
     def distribute(self, seed, is_worker=False, worker_id=""):
@@ -1497,13 +2365,15 @@ class DistributedSeed:
             # Worker node: apply offset based on worker index
             # Find worker index from enabled_worker_ids
             try:
-                # Worker IDs are passed as "worker_0", "worker_1", etc.
-                if worker_id.startswith("worker_"):
-                    worker_index = int(worker_id.split("_")[1])
-                else:
-                    # Fallback: try to parse as direct index
-                    worker_index = int(worker_id)
-                
+                # The node fires once per queue item with the same id, so
+                # memoize the parsed index per worker-id string
+                worker_index = self._worker_idx_cache.get(worker_id)
+                if worker_index is None:
+                    # Worker IDs come as "worker_0", "worker_1", ... or a
+                    # bare index; removeprefix handles both in one parse
+                    worker_index = int(worker_id.removeprefix("worker_"))
+                    self._worker_idx_cache[worker_id] = worker_index
+
                 offset = worker_index + 1
                 new_seed = seed + offset
                 debug_log(f"Distributor - Worker {worker_index}: seed={seed} → {new_seed}")
@@ -3,8 +3,16 @@ Configuration management for ComfyUI-Distributed.
 """
 import os
 import json
+import asyncio
 from .logging import log
 
+# Try to use orjson for faster config parsing/serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 CONFIG_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "gpu_config.json")
 
 def get_default_config():
@@ -23,6 +31,9 @@ def load_config():
     """Loads the config, falling back to defaults if the file is missing or invalid."""
     if os.path.exists(CONFIG_FILE):
         try:
+            if ORJSON_AVAILABLE:
+                with open(CONFIG_FILE, 'rb') as f:
+                    return orjson.loads(f.read())
             with open(CONFIG_FILE, 'r') as f:
                 return json.load(f)
         except Exception as e:
@@ -32,13 +43,30 @@ def load_config():
 def save_config(config):
     """Saves the configuration to file."""
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        if ORJSON_AVAILABLE:
+            # orjson emits bytes directly - no str -> bytes transcoding pass
+            with open(CONFIG_FILE, 'wb', buffering=65536) as f:
+                f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            with open(CONFIG_FILE, 'w', buffering=65536) as f:
+                json.dump(config, f, indent=2)
         return True
     except Exception as e:
         log(f"Error saving config: {e}")
         return False
 
+def index_workers(config):
+    """Build an id -> worker dict for O(1) lookups into the workers list."""
+    return {w["id"]: w for w in config.get("workers", [])}
+
+async def load_config_async():
+    """Loads the config in an executor so async handlers don't block on disk I/O."""
+    return await asyncio.get_running_loop().run_in_executor(None, load_config)
+
+async def save_config_async(config):
+    """Saves the config in an executor so async handlers don't block on disk I/O."""
+    return await asyncio.get_running_loop().run_in_executor(None, save_config, config)
+
 def ensure_config_exists():
     """Creates default config file if it doesn't exist. Used by __init__.py"""
     if not os.path.exists(CONFIG_FILE):
@@ -15,16 +15,22 @@ STATUS_CHECK_INTERVAL = 5.0
 # Network
 CHUNK_SIZE = 8192
 LOG_TAIL_BYTES = 65536  # 64KB
+NETWORK_INFO_CACHE_TTL = 30.0  # How long to reuse discovered network IPs
+LOG_TAIL_MMAP_THRESHOLD = 16 * 1024 * 1024  # Tail logs bigger than this via mmap
 
 # File paths
 WORKER_LOG_PATTERN = "distributed_worker_*.log"
 
 # Worker management
 WORKER_STARTUP_DELAY = 2.0
+PROCESS_SAVE_DEBOUNCE = 0.2  # Coalesce bursts of save_processes() calls
 
 # Tile transfer
 TILE_TRANSFER_TIMEOUT = 30.0
 
+# Concurrent uploads per worker when sending images individually
+WORKER_UPLOAD_CONCURRENCY = 4
+
 # Process cleanup
 PROCESS_WAIT_TIMEOUT = 3.0
 QUEUE_INIT_TIMEOUT = 5.0
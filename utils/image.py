@@ -18,7 +18,12 @@ def pil_to_tensor(image):
     return image
 
 def ensure_contiguous(tensor):
-    """Ensure tensor is contiguous in memory."""
+    """Ensure tensor is contiguous in memory.
+
+    Returns the tensor unchanged when it already is - callers rely on this
+    never copying a contiguous tensor, since they run it on every image in
+    the collection hot path.
+    """
     if not tensor.is_contiguous():
         return tensor.contiguous()
     return tensor
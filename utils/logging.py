@@ -7,16 +7,26 @@ import json
 # Config file is in parent directory
 CONFIG_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "gpu_config.json")
 
+# Cache the flag on the config file's mtime - debug_log runs on hot paths
+# and re-parsing the JSON per call cost far more than the log line itself
+_debug_cache = {"mtime": None, "value": False}
+
 def is_debug_enabled():
     """Check if debug is enabled."""
-    if os.path.exists(CONFIG_FILE):
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except OSError:
+        return False
+    if mtime != _debug_cache["mtime"]:
+        value = False
         try:
             with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-                return config.get("settings", {}).get("debug", False)
+                value = json.load(f).get("settings", {}).get("debug", False)
         except:
             pass
-    return False
+        _debug_cache["mtime"] = mtime
+        _debug_cache["value"] = value
+    return _debug_cache["value"]
 
 def debug_log(message):
     """Log debug messages only if debug is enabled in config."""
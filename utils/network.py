@@ -1,28 +1,48 @@
 """
 Network and API utilities for ComfyUI-Distributed.
 """
+import asyncio
 import aiohttp
 from aiohttp import web
 from .logging import debug_log
 
-# Shared session for connection pooling
-_client_session = None
+# One shared session per event loop for connection pooling. Sessions are
+# bound to the loop they were created on, so a single global breaks as soon
+# as a second loop (e.g. run_async_in_server_loop callers) gets involved.
+_client_sessions = {}
 
 async def get_client_session():
-    """Get or create a shared aiohttp client session."""
-    global _client_session
-    if _client_session is None or _client_session.closed:
-        connector = aiohttp.TCPConnector(limit=100, limit_per_host=30)
+    """Get or create the shared aiohttp client session for the running loop."""
+    loop = asyncio.get_running_loop()
+    session = _client_sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=30, ttl_dns_cache=300)
         # Don't set timeout here - set it per request
-        _client_session = aiohttp.ClientSession(connector=connector)
-    return _client_session
+        session = aiohttp.ClientSession(connector=connector)
+        _client_sessions[loop] = session
+    return session
 
 async def cleanup_client_session():
-    """Clean up the shared client session."""
-    global _client_session
-    if _client_session and not _client_session.closed:
-        await _client_session.close()
-        _client_session = None
+    """Clean up the shared client session owned by the running loop."""
+    session = _client_sessions.pop(asyncio.get_running_loop(), None)
+    if session and not session.closed:
+        await session.close()
+
+def close_client_session_sync():
+    """Best-effort synchronous close for when no event loop is available.
+
+    Used at interpreter shutdown if the server loop has already stopped;
+    closes the underlying connectors so sockets don't leak.
+    """
+    while _client_sessions:
+        _, session = _client_sessions.popitem()
+        if session and not session.closed:
+            try:
+                connector = session.connector
+                if connector is not None:
+                    connector._close()
+            except Exception:
+                pass
 
 async def handle_api_error(request, error, status=500):
     """Standardized error response handler."""
@@ -2,10 +2,50 @@
 Process management utilities for ComfyUI-Distributed.
 """
 import os
+import select
 import subprocess
 import platform
 import signal
 
+# Linux >= 5.3 exposes pidfds: a file descriptor tied to one specific
+# process, immune to PID reuse and pollable (readable means exited).
+PIDFD_SUPPORTED = hasattr(os, 'pidfd_open') and hasattr(signal, 'pidfd_send_signal')
+
+def open_pidfd(pid):
+    """Open a pidfd for the given PID, or None when unsupported/failed."""
+    if not PIDFD_SUPPORTED:
+        return None
+    try:
+        return os.pidfd_open(pid, 0)
+    except OSError:
+        # ENOSYS on old kernels, ESRCH if the process is already gone
+        return None
+
+def pidfd_is_alive(pidfd):
+    """Check liveness through a pidfd - readable means the process exited.
+
+    poll() rather than select(): select raises ValueError for fds at or
+    above FD_SETSIZE (1024), which a busy server can easily reach.
+    """
+    poller = select.poll()
+    poller.register(pidfd, select.POLLIN)
+    return not poller.poll(0)
+
+def pidfd_kill(pidfd, sig):
+    """Send a signal through a pidfd. Returns False if the process exited."""
+    try:
+        signal.pidfd_send_signal(pidfd, sig)
+        return True
+    except (OSError, ProcessLookupError):
+        return False
+
+def close_pidfd(pidfd):
+    """Close a pidfd, ignoring already-closed fds."""
+    try:
+        os.close(pidfd)
+    except OSError:
+        pass
+
 def is_process_alive(pid):
     """Check if a process with given PID is still alive."""
     try:
@@ -1828,7 +1828,14 @@ class DistributedExtension {
                 throw new Error(`Failed to fetch log: ${response.statusText}`);
             }
             
-            const data = await response.json();
+            // Log body is plain text; metadata comes back in headers
+            const data = {
+                content: await response.text(),
+                log_file: decodeURIComponent(response.headers.get('X-Log-File') || ''),
+                file_size: parseInt(response.headers.get('X-File-Size') || '0', 10),
+                truncated: response.headers.get('X-Truncated') === 'true',
+                lines_shown: parseInt(response.headers.get('X-Lines-Shown') || '0', 10)
+            };
             
             // Create modal dialog
             this.showLogModal(workerId, data);
@@ -2033,11 +2040,11 @@ class DistributedExtension {
             const response = await fetch(`${window.location.origin}/distributed/worker_log/${workerId}?lines=1000`);
             if (!response.ok) throw new Error('Failed to fetch log');
             
-            const data = await response.json();
+            const content = await response.text();
             
             // Update content
             const shouldAutoScroll = logContent.scrollTop + logContent.clientHeight >= logContent.scrollHeight - 50;
-            logContent.textContent = data.content;
+            logContent.textContent = content;
             
             // Auto-scroll if was at bottom
             if (shouldAutoScroll) {